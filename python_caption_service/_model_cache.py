@@ -0,0 +1,43 @@
+"""
+Shared model singletons.
+
+Loading Whisper weights costs seconds of disk I/O per call; cache the
+loaded models per (name, device, compute type) so repeated pipeline
+runs and tests in one process reuse them.
+"""
+
+import os
+from functools import lru_cache
+
+
+def detect_whisper_device():
+    """
+    Pick (device, compute_type) for faster-whisper: CUDA with float16
+    when a GPU is visible, else CPU with int8_float32 (int8 weights,
+    fp32 accumulators - same VNNI speed as plain int8, better accuracy).
+    The WHISPER_COMPUTE_TYPE env var overrides the compute type either way.
+    """
+    try:
+        import ctranslate2
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda", os.environ.get("WHISPER_COMPUTE_TYPE", "float16")
+    except Exception:
+        pass
+    return "cpu", os.environ.get("WHISPER_COMPUTE_TYPE", "int8_float32")
+
+
+@lru_cache(maxsize=2)
+def get_faster_whisper(name: str = "base", device: str = "cpu", compute: str = "int8"):
+    from faster_whisper import WhisperModel
+    kwargs = {}
+    if device == "cpu":
+        # int8 GEMMs scale with physical cores; a second worker overlaps
+        # encoder and decoder batches
+        kwargs = dict(cpu_threads=os.cpu_count() or 4, num_workers=2)
+    return WhisperModel(name, device=device, compute_type=compute, **kwargs)
+
+
+@lru_cache(maxsize=2)
+def get_openai_whisper(name: str = "base"):
+    import whisper
+    return whisper.load_model(name)
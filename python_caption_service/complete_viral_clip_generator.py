@@ -4,6 +4,8 @@ Complete Viral Clip Generator
 Combines all components: YouTube download, transcription, viral scoring, layout processing, and caption generation
 """
 
+import functools
+import heapq
 import os
 import sys
 import time
@@ -457,9 +459,16 @@ class CompleteViralClipGenerator:
             print(f"Failed to create mock video: {e}")
             return None
     
-    def _get_mock_transcript(self) -> List[Dict]:
-        """Mock transcript for testing when Whisper is not available"""
-        return [
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_mock_transcript() -> tuple:
+        """Mock transcript for testing when Whisper is not available.
+
+        Built once per interpreter and shared across instances; returned
+        as a tuple so callers treat it as immutable (copy before
+        mutating).
+        """
+        return (
             {"start": 0.0, "end": 8.0, "text": "This is the biggest secret nobody told you about making viral videos."},
             {"start": 8.0, "end": 15.0, "text": "Today I'm going to reveal the crazy mistake that's killing your engagement."},
             {"start": 15.0, "end": 22.0, "text": "Watch this technique that will completely change how you create content."},
@@ -470,7 +479,7 @@ class CompleteViralClipGenerator:
             {"start": 52.0, "end": 60.0, "text": "Let me show you the exact framework that works every single time."},
             {"start": 60.0, "end": 68.0, "text": "You won't believe how simple this actually is once you understand it."},
             {"start": 68.0, "end": 75.0, "text": "The biggest mistake people make is focusing on the wrong metrics."},
-        ]
+        )
     
     def _find_viral_moments(
         self, 
@@ -528,8 +537,8 @@ class CompleteViralClipGenerator:
         print(f"   Smart maximum clips: {smart_max} (automatic AI decision)")
         print(f"   Returning: {actual_clips_to_return} clips")
         
-        # Sort by score descending and take the top actual_clips_to_return
-        top_clips = sorted(all_viral_clips, key=lambda x: x["score"], reverse=True)[:actual_clips_to_return]
+        # Top-k heap selection by score - cheaper than sorting every clip
+        top_clips = heapq.nlargest(actual_clips_to_return, all_viral_clips, key=lambda x: x["score"])
         
         # Show score distribution for transparency
         if top_clips:
@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures for the caption service tests.
+
+Run the suite across cores with:
+    pytest -n auto -m "not network"
+Tests marked "network" download from YouTube or Hugging Face and are
+excluded in CI.
+"""
+
+import pytest
+
+from test_helpers import get_processor
+
+
+@pytest.fixture(scope="session")
+def processor():
+    """Session-wide OpusProcessor shared by every test."""
+    return get_processor()
@@ -5,19 +5,55 @@ Face Detection Module for Auto Layout
 Uses MediaPipe to detect and track faces in video for intelligent cropping.
 """
 
+import os
 import cv2
 import mediapipe as mp
 import numpy as np
 from typing import Tuple, Optional
 
 class FaceDetector:
-    def __init__(self):
-        """Initialize MediaPipe face detection."""
+    def __init__(self, device: str = "cpu"):
+        """
+        Initialize MediaPipe face detection.
+
+        Args:
+            device: "gpu" tries the MediaPipe Tasks API with the GPU delegate
+                    in VIDEO running mode (needs a .tflite model, see the
+                    MEDIAPIPE_FACE_MODEL env var); anything else - or any
+                    setup failure - uses the CPU solutions pipeline.
+        """
+        self._tasks_detector = None
+        if device.lower() == "gpu":
+            try:
+                from mediapipe.tasks import python as mp_tasks
+                from mediapipe.tasks.python import vision as mp_vision
+                model_path = os.environ.get("MEDIAPIPE_FACE_MODEL", "blaze_face_short_range.tflite")
+                options = mp_vision.FaceDetectorOptions(
+                    base_options=mp_tasks.BaseOptions(
+                        model_asset_path=model_path,
+                        delegate=mp_tasks.BaseOptions.Delegate.GPU
+                    ),
+                    running_mode=mp_vision.RunningMode.VIDEO,
+                    min_detection_confidence=0.1
+                )
+                self._tasks_detector = mp_vision.FaceDetector.create_from_options(options)
+                print("Face detection using GPU Tasks pipeline")
+            except Exception as e:
+                print(f"GPU face detection unavailable ({e}), using CPU pipeline")
+
         self.mp_face_detection = mp.solutions.face_detection
         self.mp_drawing = mp.solutions.drawing_utils
         self.face_detection = self.mp_face_detection.FaceDetection(
             model_selection=1, min_detection_confidence=0.1
         )
+
+    def _detect_faces(self, rgb_frame: np.ndarray, timestamp_ms: int):
+        """Run one detection, on the GPU Tasks pipeline when available."""
+        if self._tasks_detector is not None:
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+            result = self._tasks_detector.detect_for_video(mp_image, timestamp_ms)
+            return result.detections
+        return self.face_detection.process(rgb_frame).detections
     
     def detect_face_center(self, video_path: str, prefer_left_side: bool = True, segment_time: Optional[float] = None) -> Tuple[int, int]:
         """
@@ -38,44 +74,61 @@ class FaceDetector:
         frame_count = 0
         sample_frames = 30  # Sample every 30 frames for performance
         
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+
         try:
             while cap.isOpened() and frame_count < 300:  # Limit to first 10 seconds at 30fps
+                if frame_count % sample_frames != 0:
+                    # grab() advances without decoding - skipped frames cost
+                    # almost nothing
+                    if not cap.grab():
+                        break
+                    frame_count += 1
+                    continue
+
                 ret, frame = cap.read()
                 if not ret:
                     break
-                
-                if frame_count % sample_frames == 0:
-                    # Convert BGR to RGB
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    results = self.face_detection.process(rgb_frame)
-                    
-                    if results.detections:
-                        print(f"Frame {frame_count}: Found {len(results.detections)} faces")
-                        # Process all detected faces and find the most prominent one
-                        for i, detection in enumerate(results.detections):
+
+                # Convert BGR to RGB
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                detections = self._detect_faces(rgb_frame, int(frame_count * 1000 / fps))
+
+                if detections:
+                    print(f"Frame {frame_count}: Found {len(detections)} faces")
+                    # Process all detected faces and find the most prominent one
+                    for i, detection in enumerate(detections):
+                        h, w, _ = frame.shape
+                        if self._tasks_detector is not None:
+                            # Tasks API returns pixel-space bounding boxes
+                            tb = detection.bounding_box
+                            face_x = int(tb.origin_x + tb.width / 2)
+                            face_y = int(tb.origin_y + tb.height / 2)
+                            face_size = (tb.width * tb.height) / float(w * h)
+                            confidence = detection.categories[0].score
+                        else:
                             bbox = detection.location_data.relative_bounding_box
-                            h, w, _ = frame.shape
-                            
+
                             # Calculate face center and size
                             face_x = int((bbox.xmin + bbox.width / 2) * w)
                             face_y = int((bbox.ymin + bbox.height / 2) * h)
                             face_size = bbox.width * bbox.height
                             confidence = detection.score[0]
-                            
-                            # Weight by both size and confidence to find most prominent face
-                            prominence_score = face_size * confidence
-                            
-                            print(f"  Face {i}: center=({face_x}, {face_y}), size={face_size:.4f}, conf={confidence:.3f}, prominence={prominence_score:.4f}")
-                            
-                            face_centers.append({
-                                'center': (face_x, face_y),
-                                'size': face_size,
-                                'confidence': confidence,
-                                'prominence': prominence_score
-                            })
-                    else:
-                        print(f"Frame {frame_count}: No faces detected")
-                
+
+                        # Weight by both size and confidence to find most prominent face
+                        prominence_score = face_size * confidence
+
+                        print(f"  Face {i}: center=({face_x}, {face_y}), size={face_size:.4f}, conf={confidence:.3f}, prominence={prominence_score:.4f}")
+
+                        face_centers.append({
+                            'center': (face_x, face_y),
+                            'size': face_size,
+                            'confidence': confidence,
+                            'prominence': prominence_score
+                        })
+                else:
+                    print(f"Frame {frame_count}: No faces detected")
+
                 frame_count += 1
                 
         finally:
@@ -152,3 +205,5 @@ class FaceDetector:
         """Cleanup MediaPipe resources."""
         if hasattr(self, 'face_detection'):
             self.face_detection.close()
+        if getattr(self, '_tasks_detector', None) is not None:
+            self._tasks_detector.close()
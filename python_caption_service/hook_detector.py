@@ -3,13 +3,27 @@ Hook Detection and Viral Scoring System
 Similar to Opus Clip / Ssemble viral moment detection
 """
 
+import heapq
 import re
 import json
 import sys
+import numpy as np
 from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
 from datetime import timedelta
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 # Fix Windows console encoding for Hindi/Unicode characters
 if sys.platform == 'win32':
     import io
@@ -115,7 +129,38 @@ class HookDetector:
         self.min_length = min_length
         self.max_length = max_length
         self.sentiment_analyzer = None
-        
+
+        # Compile keyword matching once: a single pass over the text
+        # instead of one substring scan per keyword. Prefer Hyperscan's
+        # SIMD block-mode database, then the Aho-Corasick automaton, then
+        # a precompiled regex alternation
+        self._kw_hs_db = None
+        if HYPERSCAN_AVAILABLE:
+            try:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[re.escape(kw).encode() for kw in self.HOOK_KEYWORDS],
+                    ids=list(range(len(self.HOOK_KEYWORDS))),
+                    flags=[hyperscan.HS_FLAG_CASELESS] * len(self.HOOK_KEYWORDS),
+                )
+                self._kw_hs_db = db
+            except Exception as e:
+                print(f"Hyperscan unavailable ({e}), falling back to automaton/regex matching")
+                self._kw_hs_db = None
+
+        if AHOCORASICK_AVAILABLE:
+            self._kw_automaton = ahocorasick.Automaton()
+            for keyword in self.HOOK_KEYWORDS:
+                self._kw_automaton.add_word(keyword, keyword)
+            self._kw_automaton.make_automaton()
+            self._kw_regex = None
+        else:
+            self._kw_automaton = None
+            # Longest-first alternation inside a lookahead so overlapping
+            # keywords at the same position are still found
+            pattern = '|'.join(map(re.escape, sorted(self.HOOK_KEYWORDS, key=len, reverse=True)))
+            self._kw_regex = re.compile(f'(?=({pattern}))')
+
     def load_sentiment_model(self):
         """Load multilingual sentiment analysis model (supports Hindi, Nepali, English, 100+ languages)"""
         try:
@@ -273,49 +318,90 @@ class HookDetector:
         Returns:
             List of scored clips
         """
-        for clip in clips:
-            clip.viral_score = self._calculate_viral_score(clip)
-        
+        scores = self.score_segments(clips)
+
         # Sort by viral score (highest first)
-        return sorted(clips, key=lambda x: x.viral_score, reverse=True)
-    
-    def _calculate_viral_score(self, clip: VideoClip) -> float:
-        """Calculate viral score for a single clip"""
-        score = 0.0
-        
-        # 1. Hook keyword detection (+2 points each)
-        hook_keywords = self._detect_hook_keywords(clip.transcript)
-        clip.hook_keywords = hook_keywords
-        score += len(hook_keywords) * 2
-        
-        # 2. Question detection (+2 points)
-        has_question = self._detect_question_hook(clip.transcript)
-        clip.has_question = has_question
-        if has_question:
-            score += 2
-        
-        # 3. Sentiment/emotion analysis (0-2 points)
-        emotion_score = self._analyze_emotion(clip.transcript)
-        clip.emotion_score = emotion_score
-        score += emotion_score * 2
-        
-        # 4. Length bonus (+1 if within 10% of target)
-        length_bonus = self._calculate_length_bonus(clip.duration)
-        clip.length_bonus = length_bonus
-        score += length_bonus
-        
-        return score
-    
+        order = np.argsort(-scores, kind='stable')
+        return [clips[i] for i in order]
+
+    # Emotion contributes at most 2.0 * 1.0 to a viral score; this bound
+    # lets the scorer prune clips that can't reach the top-k before
+    # paying for the sentiment model
+    _EMOTION_MAX_BONUS = 2.0
+
+    def score_segments(self, clips: List[VideoClip], top_n: int = None) -> np.ndarray:
+        """
+        Score clips column-wise and return one viral score per clip.
+
+        Each component (keywords, questions, emotion, length bonus) is
+        computed as a vector and the final score is composed in NumPy, so
+        the per-clip Python overhead stays constant as transcripts grow.
+
+        When top_n is given, the expensive sentiment pass only runs for
+        clips whose cheap-component score plus the bounded emotion bonus
+        could still reach the top_n (threshold-algorithm style early
+        termination); other clips keep emotion 0.0, which cannot change
+        the top_n ranking since emotion never scores below zero.
+        """
+        if not clips:
+            return np.zeros(0)
+
+        texts = [clip.transcript for clip in clips]
+        n = len(clips)
+
+        keyword_lists = [self._detect_hook_keywords(text) for text in texts]
+        kw_counts = np.fromiter((len(kws) for kws in keyword_lists), dtype=np.float64, count=n)
+        questions = np.fromiter((self._detect_question_hook(text) for text in texts), dtype=np.float64, count=n)
+        length_bonuses = np.fromiter((self._calculate_length_bonus(clip.duration) for clip in clips), dtype=np.float64, count=n)
+        cheap_scores = 2.0 * kw_counts + 2.0 * questions + length_bonuses
+
+        # One batched transformer call for every surviving transcript
+        # instead of a pipeline invocation per clip
+        emotions = np.zeros(n)
+        if top_n is not None and 0 < top_n < n:
+            kth_cheap = np.partition(cheap_scores, -top_n)[-top_n]
+            promising = np.flatnonzero(cheap_scores + self._EMOTION_MAX_BONUS >= kth_cheap)
+            emotions[promising] = np.asarray(
+                self._analyze_emotions_batch([texts[i] for i in promising]), dtype=np.float64
+            )
+        else:
+            emotions[:] = np.asarray(self._analyze_emotions_batch(texts), dtype=np.float64)
+
+        scores = cheap_scores + 2.0 * emotions
+
+        for clip, kws, question, emotion, bonus, score in zip(
+            clips, keyword_lists, questions, emotions, length_bonuses, scores
+        ):
+            clip.hook_keywords = kws
+            clip.has_question = bool(question)
+            clip.emotion_score = float(emotion)
+            clip.length_bonus = float(bonus)
+            clip.viral_score = float(score)
+
+        return scores
+
     def _detect_hook_keywords(self, text: str) -> List[str]:
-        """Detect hook keywords in text"""
+        """Detect hook keywords in text with one pass over the lowercased text"""
         text_lower = text.lower()
-        found_keywords = []
-        
-        for keyword in self.HOOK_KEYWORDS:
-            if keyword in text_lower:
-                found_keywords.append(keyword)
-        
-        return found_keywords
+
+        if self._kw_hs_db is not None:
+            matched_ids = set()
+            self._kw_hs_db.scan(
+                text_lower.encode(),
+                match_event_handler=lambda kw_id, *_: matched_ids.add(kw_id)
+            )
+            matches = {self.HOOK_KEYWORDS[kw_id] for kw_id in matched_ids}
+        elif self._kw_automaton is not None:
+            matches = {value for _, value in self._kw_automaton.iter(text_lower)}
+        else:
+            matches = set(self._kw_regex.findall(text_lower))
+
+        # Keep the original keyword ordering, and count keywords that only
+        # occur inside a longer matched keyword (e.g. "secret" in "secrets")
+        return [
+            keyword for keyword in self.HOOK_KEYWORDS
+            if keyword in matches or any(keyword in match for match in matches)
+        ]
     
     def _detect_question_hook(self, text: str) -> bool:
         """Detect if text starts with a question"""
@@ -348,32 +434,15 @@ class HookDetector:
                 return 0.0
             
             results = self.sentiment_analyzer(text)
-            
+
             # Handle multilingual sentiment model output
             # Format: [{'label': 'positive'/'negative'/'neutral', 'score': 0.95}]
             if isinstance(results, list) and len(results) > 0:
-                result = results[0]
-                label = result.get('label', '').lower()
-                score = result.get('score', 0.0)
-                
-                # Map sentiment to viral potential
-                # Positive and negative emotions drive engagement
-                if label in ['positive', 'pos']:
-                    # Positive emotions are viral (joy, excitement, inspiration)
-                    return min(1.0, score * 1.2)  # 20% boost for positive
-                elif label in ['negative', 'neg']:
-                    # Negative emotions are also viral (anger, shock, controversy)
-                    return min(1.0, score * 1.3)  # 30% boost for negative (more viral)
-                elif label in ['neutral']:
-                    # Neutral is less viral but still valid
-                    return score * 0.5
-                else:
-                    # Unknown label, use raw score
-                    return score
-            
+                return self._emotion_from_result(results[0])
+
             # Fallback for unexpected format
             return 0.5
-        
+
         except Exception as e:
             # Don't print error for every segment - just return neutral score
             # Only print if it's a new type of error
@@ -382,6 +451,52 @@ class HookDetector:
                 print(f"Emotion analysis error: {error_msg[:100]}")
             return 0.0
     
+    def _emotion_from_result(self, result: Dict[str, Any]) -> float:
+        """Map one sentiment pipeline result to a viral-potential score"""
+        # Nested list format from return_all_scores models
+        if isinstance(result, list):
+            result = max(result, key=lambda r: r.get('score', 0.0)) if result else {}
+
+        label = result.get('label', '').lower()
+        score = result.get('score', 0.0)
+
+        # Positive and negative emotions drive engagement
+        if label in ['positive', 'pos']:
+            # Positive emotions are viral (joy, excitement, inspiration)
+            return min(1.0, score * 1.2)  # 20% boost for positive
+        elif label in ['negative', 'neg']:
+            # Negative emotions are also viral (anger, shock, controversy)
+            return min(1.0, score * 1.3)  # 30% boost for negative (more viral)
+        elif label in ['neutral']:
+            # Neutral is less viral but still valid
+            return score * 0.5
+        else:
+            # Unknown label, use raw score
+            return score
+
+    def _analyze_emotions_batch(self, texts: List[str]) -> List[float]:
+        """
+        Analyze emotional intensity for many transcripts in one pipeline call.
+
+        Submitting the whole list with batch_size lets the transformer run
+        batched matmuls instead of paying per-text Python/framework overhead.
+        """
+        if not self.sentiment_analyzer or not texts:
+            return [0.0] * len(texts)
+
+        try:
+            # Pipelines reject empty strings; keep indices aligned with a space
+            results = self.sentiment_analyzer(
+                [text.strip() or " " for text in texts],
+                batch_size=32, truncation=True
+            )
+            return [self._emotion_from_result(result) for result in results]
+        except Exception as e:
+            print(f"Batched emotion analysis error: {str(e)[:100]}")
+            # Fall back to the per-text path so one bad batch doesn't zero
+            # every clip
+            return [self._analyze_emotion(text) for text in texts]
+
     def _calculate_length_bonus(self, duration: float) -> float:
         """Calculate bonus for optimal length"""
         target = self.target_length
@@ -393,31 +508,36 @@ class HookDetector:
         
         return 0.0
     
-    def find_viral_clips(self, transcript_segments: List[TranscriptSegment], top_n: int = 10) -> List[Dict[str, Any]]:
+    def find_viral_clips(self, transcript_segments: List[TranscriptSegment], top_n: int = 10,
+                         min_score: float = 0.0) -> List[Dict[str, Any]]:
         """
         Main method to find viral clips from transcript
-        
+
         Args:
             transcript_segments: Raw transcript segments
             top_n: Number of top clips to return
-            
+            min_score: Drop clips scoring below this before ranking
+
         Returns:
             List of top viral clips as dictionaries
         """
         print(f"Analyzing transcript for viral clips...")
         print(f"   Target length: {self.target_length}s")
         print(f"   Range: {self.min_length}-{self.max_length}s")
-        
+
         # Step 1: Segment transcript into clips
         clips = self.segment_transcript(transcript_segments)
         print(f"Generated {len(clips)} candidate clips")
-        
-        # Step 2: Score clips for viral potential
-        scored_clips = self.score_clips(clips)
+
+        # Step 2: Score clips for viral potential. A top-k heap selection
+        # beats sorting all N candidates when only top_n survive anyway,
+        # and the bounded-pruning path skips sentiment for hopeless clips
+        scores = self.score_segments(clips, top_n=top_n)
+        candidates = [clip for clip, score in zip(clips, scores) if score >= min_score]
         print(f"Scored and ranked clips")
-        
+
         # Step 3: Return top N clips
-        top_clips = scored_clips[:top_n]
+        top_clips = heapq.nlargest(top_n, candidates, key=lambda clip: clip.viral_score)
         
         print(f"Found {len(top_clips)} viral clips")
         for i, clip in enumerate(top_clips[:3]):  # Show top 3
@@ -426,18 +546,47 @@ class HookDetector:
         return [clip.to_dict() for clip in top_clips]
 
 
+# SoA layout for synthetic transcripts: float32 columns for timing plus
+# an object column for text, instead of a ~232-byte dict per segment
+SEGMENT_DTYPE = np.dtype([('start', 'f4'), ('end', 'f4'), ('text', 'O')])
+
+
+def segments_to_dicts(segment_array) -> List[Dict]:
+    """Thin shim converting a SEGMENT_DTYPE array back to list-of-dicts."""
+    return [
+        {'start': float(start), 'end': float(end), 'text': text}
+        for start, end, text in zip(
+            segment_array['start'], segment_array['end'], segment_array['text']
+        )
+    ]
+
+
 def parse_whisper_segments(whisper_segments: List[Dict]) -> List[TranscriptSegment]:
     """
     Convert Whisper output to TranscriptSegment objects
-    
+
     Args:
-        whisper_segments: Raw segments from Whisper transcription
-        
+        whisper_segments: Raw segments from Whisper transcription, either
+            a list of segment objects/dicts or a SEGMENT_DTYPE array
+
     Returns:
         List of TranscriptSegment objects
     """
+    # Structured array (SoA) form: read whole columns, no per-dict .get
+    if isinstance(whisper_segments, np.ndarray) and whisper_segments.dtype.names:
+        return [
+            TranscriptSegment(
+                start_time=float(start),
+                end_time=float(end),
+                text=text.strip(),
+            )
+            for start, end, text in zip(
+                whisper_segments['start'], whisper_segments['end'], whisper_segments['text']
+            )
+        ]
+
     segments = []
-    
+
     for segment in whisper_segments:
         # Handle both Whisper Segment objects and dictionary formats
         if hasattr(segment, 'start'):
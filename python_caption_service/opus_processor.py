@@ -5,9 +5,13 @@ This module handles the core Opus Clip processing logic for generating
 captions with various templates, word-level synchronization, and animation effects.
 """
 
+import io
 import re
 import math
 import os
+import subprocess
+import numpy as np
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 import random
 
@@ -45,6 +49,96 @@ except ImportError:
     SPEAKER_DIARIZATION_AVAILABLE = False
     print("Warning: pyannote.audio not available. PodcastPro style will use fallback mode.")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _karaoke_word_timings_numpy(starts: np.ndarray, ends: np.ndarray):
+    """
+    Vectorized karaoke easing math: per-word duration (ms, floored at
+    100), ease-in length (25% capped at 100 ms) and ease-out start.
+    """
+    durations = np.maximum(100, ((ends - starts) * 1000.0).astype(np.int64))
+    ease_ins = np.minimum(100, durations // 4)
+    ease_outs = np.maximum(ease_ins, durations - 100)
+    return durations, ease_ins, ease_outs
+
+
+def _viral_word_timings_numpy(starts: np.ndarray, ends: np.ndarray):
+    """
+    TikTokViral entrance schedule: per-word duration (ms, floored at
+    200) plus its one-third and two-thirds split points for the color
+    cycle.
+    """
+    durations = np.maximum(200, ((ends - starts) * 1000.0).astype(np.int64))
+    return durations, durations // 3, durations * 2 // 3
+
+
+def _swipeup_word_timings_numpy(starts: np.ndarray, ends: np.ndarray, line_start: float):
+    """
+    SwipeUp karaoke tags: per-word lead-in delay and fill duration in
+    centiseconds (the \\k unit), plus the raw fill duration in ms.
+    """
+    prev_ends = np.empty_like(ends)
+    prev_ends[0] = line_start
+    prev_ends[1:] = ends[:-1]
+    delays_cs = (np.maximum(0.0, (starts - prev_ends) * 1000.0) / 10).astype(np.int64)
+    durations_ms = np.maximum(10, ((ends - starts) * 1000.0).astype(np.int64))
+    return delays_cs, durations_ms // 10, durations_ms
+
+
+if NUMBA_AVAILABLE:
+    # Compiled once per interpreter lifetime and cached on disk
+    _karaoke_word_timings = njit(cache=True)(_karaoke_word_timings_numpy)
+    _viral_word_timings = njit(cache=True)(_viral_word_timings_numpy)
+    _swipeup_word_timings = njit(cache=True)(_swipeup_word_timings_numpy)
+else:
+    _karaoke_word_timings = _karaoke_word_timings_numpy
+    _viral_word_timings = _viral_word_timings_numpy
+    _swipeup_word_timings = _swipeup_word_timings_numpy
+
+
+# Hardware encoder per ffmpeg hwaccel backend
+_HWACCEL_ENCODERS = {
+    'cuda': 'h264_nvenc',
+    'qsv': 'h264_qsv',
+    'videotoolbox': 'h264_videotoolbox',
+}
+
+
+@lru_cache(maxsize=None)
+def _available_hwaccels() -> frozenset:
+    """Probe `ffmpeg -hwaccels` once per process and cache the result."""
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-hwaccels'],
+            capture_output=True, text=True, check=True
+        )
+        return frozenset(line.strip() for line in result.stdout.splitlines()[1:] if line.strip())
+    except Exception:
+        return frozenset()
+
+
+def _resolve_hwaccel(hwaccel: str):
+    """
+    Map a requested hwaccel backend to (ffmpeg input kwargs, video codec).
+
+    Returns CPU defaults (no input flags, libx264) when the backend is
+    "none" or not reported by this ffmpeg build. The filter graph stays
+    on the CPU either way - boxblur/overlay/ass have no GPU variants
+    here - so the acceleration covers decode and encode.
+    """
+    accel = (hwaccel or 'none').lower()
+    if accel != 'none':
+        if accel in _available_hwaccels():
+            return {'hwaccel': accel}, _HWACCEL_ENCODERS.get(accel, 'libx264')
+        print(f"Requested hwaccel '{accel}' not available, using CPU pipeline")
+    return {}, 'libx264'
+
+
 # --- Opus Clip Template Definitions ---
 OPUS_TEMPLATES = {
     "OpusClipStyle": {
@@ -493,6 +587,21 @@ class OpusProcessor:
         h, m = divmod(m, 60)
         return f"{int(h):d}:{int(m):02d}:{s:05.2f}"
 
+    def format_times(self, seconds: np.ndarray) -> List[str]:
+        """
+        Vectorized format_time for a whole array of timestamps: the
+        sexagesimal split happens once in integer NumPy math instead of
+        a divmod pair per word.
+        """
+        cs = np.round(np.asarray(seconds, dtype=np.float64) * 100).astype(np.int64)
+        hours = cs // 360000
+        minutes = (cs // 6000) % 60
+        secs_cs = cs % 6000
+        return [
+            f"{h:d}:{m:02d}:{sc // 100:02d}.{sc % 100:02d}"
+            for h, m, sc in zip(hours, minutes, secs_cs)
+        ]
+
     def create_ass_header(self, style_def: str) -> str:
         """Creates the ASS file header with styles.
 
@@ -750,11 +859,20 @@ class OpusProcessor:
         else:
             return color_map.get('default', '&H00FFFFFF&')
 
-    def generate_karaoke_captions(self, segments: List[Dict[str, Any]], template_name: str, audio_path: Optional[str] = None, layout_mode: str = "fit") -> str:
+    def generate_karaoke_captions(self, segments: List[Dict[str, Any]], template_name: str, audio_path: Optional[str] = None, layout_mode: str = "fit", out_path: Optional[str] = None) -> str:
         template = self.templates.get(template_name)
         if not template:
             raise ValueError(f"Template '{template_name}' not found.")
 
+        # Accept structured arrays (SoA columns: 'start', 'end', 'text')
+        # alongside the list-of-dicts form; expand into the dict shape the
+        # chunkers expect
+        if isinstance(segments, np.ndarray):
+            segments = [
+                {'text': text, 'start': float(start), 'end': float(end)}
+                for start, end, text in zip(segments['start'], segments['end'], segments['text'])
+            ]
+
         ass_header = self.create_ass_header(template['style_def'])
         events = []
         
@@ -769,35 +887,41 @@ class OpusProcessor:
             # Karaoke style: instant color highlighting with smooth scaling animation
             for chunk_idx, chunk in enumerate(word_chunks):
                 position = template['positions'][chunk_idx % len(template['positions'])]
-                
+
+                # Easing math for the whole chunk in one (numba-compiled
+                # when available) vectorized call instead of per-word
+                # Python arithmetic
+                word_starts = np.fromiter((w['start'] for w in chunk['words']), dtype=np.float64, count=len(chunk['words']))
+                word_ends = np.fromiter((w['end'] for w in chunk['words']), dtype=np.float64, count=len(chunk['words']))
+                durations_ms, ease_ins_ms, ease_outs_ms = _karaoke_word_timings(word_starts, word_ends)
+                start_times = self.format_times(word_starts)
+                end_times = self.format_times(word_ends)
+
                 # Create separate events for each word to achieve proper timing and scaling
                 for i in range(len(chunk['words'])):
-                    word_info = chunk['words'][i]
-                    word_start_s = word_info['start']
-                    word_end_s = word_info['end']
-                    word_duration_ms = max(100, (word_end_s - word_start_s) * 1000)
+                    word_duration_ms = durations_ms[i]
 
                     # Event duration: exactly the word's duration for proper scaling timing
-                    start_time = self.format_time(word_start_s)
-                    end_time = self.format_time(word_end_s)
+                    start_time = start_times[i]
+                    end_time = end_times[i]
+
+                    # Smooth easing durations (25% or 100ms max for ease-in)
+                    ease_in_duration = ease_ins_ms[i]
+                    ease_out_start = ease_outs_ms[i]
 
-                    # Calculate smooth easing durations
-                    ease_in_duration = min(100, word_duration_ms // 4)  # 25% or 100ms max for ease-in
-                    ease_out_start = max(ease_in_duration, word_duration_ms - 100)  # Start ease-out
-                    
                     # Build line with current word highlighted and scaled, others normal
-                    line_text = ""
+                    line_parts = []
                     for j, w_info in enumerate(chunk['words']):
                         current_word_text = w_info['word'].strip().upper()  # Uppercase
                         if i == j:
                             # Current word: green highlight + smooth scaling (1.0 -> 1.25 -> 1.0)
                             scale_animation = fr"\t(0,{ease_in_duration},\fscx125,\fscy125)\t({ease_out_start},{word_duration_ms},\fscx100,\fscy100)"
-                            line_text += f"{{\\1c&H00FF00&{scale_animation}}}{current_word_text}{{\\1c&HFFFFFF&}} "
+                            line_parts.append(f"{{\\1c&H00FF00&{scale_animation}}}{current_word_text}{{\\1c&HFFFFFF&}} ")
                         else:
                             # Other words: white, normal scale (1.0)
-                            line_text += f"{{\\fscx100\\fscy100}}{current_word_text} "
+                            line_parts.append(f"{{\\fscx100\\fscy100}}{current_word_text} ")
 
-                    event = self.create_ass_event(line_text.strip(), start_time, end_time, "Default", position)
+                    event = self.create_ass_event("".join(line_parts).strip(), start_time, end_time, "Default", position)
                     events.append(event)
                     
                 # Add transition events between words to ensure smooth reset
@@ -814,11 +938,11 @@ class OpusProcessor:
                         gap_end_time = self.format_time(gap_end_s)
                         
                         # Show all words in normal state during gap
-                        gap_text = ""
-                        for w_info in chunk['words']:
-                            word_text = w_info['word'].strip().upper()
-                            gap_text += f"{{\\fscx100\\fscy100}}{word_text} "
-                        
+                        gap_text = "".join(
+                            f"{{\\fscx100\\fscy100}}{w_info['word'].strip().upper()} "
+                            for w_info in chunk['words']
+                        )
+
                         gap_event = self.create_ass_event(gap_text.strip(), gap_start_time, gap_end_time, "Default", position)
                         events.append(gap_event)
         elif template_name == "Glitch":
@@ -856,7 +980,7 @@ class OpusProcessor:
 
                     # Build line with fade-in and glitch effect on active word
                     line_prefix = f"{{\\fad(200,100)}}"
-                    line_text = ""
+                    line_parts = []
                     for j, w_info in enumerate(words_to_render):
                         w_text = w_info['word'].strip().upper()
                         is_active = (j == active_index)
@@ -865,12 +989,12 @@ class OpusProcessor:
                             # Active keyword: purple color flash and glitch animation
                             glitch_anim = fr"\t(0,50,\frx-7)\t(50,100,\frx7)\t(100,150,\frx0)"
                             color_flash = "\\1c&HFF009D&" # Electric Purple
-                            line_text += f"{{{color_flash}{glitch_anim}}}{w_text} "
+                            line_parts.append(f"{{{color_flash}{glitch_anim}}}{w_text} ")
                         else:
                             # Inactive words: default style (white)
-                            line_text += f"{{\\r}}{w_text} "
+                            line_parts.append(f"{{\\r}}{w_text} ")
 
-                    full_line = f"{line_prefix}{line_text.strip()}"
+                    full_line = f"{line_prefix}{''.join(line_parts).strip()}"
                     event = self.create_ass_event(full_line, start_time, end_time, style_name, position)
                     events.append(event)
 
@@ -1595,25 +1719,30 @@ class OpusProcessor:
             
             for chunk_idx, chunk in enumerate(word_chunks):
                 position = template['positions'][chunk_idx % len(template['positions'])]
-                
+
+                # Whole-chunk timing schedule in one vectorized call
+                word_starts = np.fromiter((w['start'] for w in chunk['words']), dtype=np.float64, count=len(chunk['words']))
+                word_ends = np.fromiter((w['end'] for w in chunk['words']), dtype=np.float64, count=len(chunk['words']))
+                durations_ms, thirds_ms, two_thirds_ms = _viral_word_timings(word_starts, word_ends)
+                start_times = self.format_times(word_starts)
+                end_times = self.format_times(word_ends)
+
                 # TikTokViral: Each word gets its own explosive entrance
                 for word_idx, word_info in enumerate(chunk['words']):
-                    word_start_s = word_info['start']
-                    word_end_s = word_info['end']
-                    word_duration_ms = max(200, (word_end_s - word_start_s) * 1000)
-                    
-                    start_time = self.format_time(word_start_s)
-                    end_time = self.format_time(word_end_s)
-                    
+                    word_duration_ms = durations_ms[word_idx]
+
+                    start_time = start_times[word_idx]
+                    end_time = end_times[word_idx]
+
                     word_text = word_info['word'].strip().upper()  # Always uppercase for viral energy
-                    
+
                     # EXPLOSIVE VIRAL EFFECTS - completely different from Karaoke
                     # 1. Massive scale explosion: 50% -> 180% -> 120% -> 100%
                     explosion_scale = fr"\t(0,100,\fscx180\fscy180)\t(100,250,\fscx120\fscy120)\t(250,{word_duration_ms},\fscx100\fscy100)"
-                    
+
                     # 2. Bright electric colors cycling: Cyan -> Magenta -> Yellow
-                    color_cycle = fr"\t(0,{word_duration_ms//3},\1c&H00FFFF00&)\t({word_duration_ms//3},{word_duration_ms*2//3},\1c&H00FF00FF&)\t({word_duration_ms*2//3},{word_duration_ms},\1c&H0000FFFF&)"
-                    
+                    color_cycle = fr"\t(0,{thirds_ms[word_idx]},\1c&H00FFFF00&)\t({thirds_ms[word_idx]},{two_thirds_ms[word_idx]},\1c&H00FF00FF&)\t({two_thirds_ms[word_idx]},{word_duration_ms},\1c&H0000FFFF&)"
+
                     # 3. Glow pulse effect
                     glow_pulse = fr"\t(0,150,\blur8\bord0\shad6)\t(150,{word_duration_ms},\blur4\bord0\shad3)"
                     
@@ -1671,42 +1800,56 @@ class OpusProcessor:
                 start_time = self.format_time(chunk_start_s)
                 end_time = self.format_time(chunk_end_s)
 
-                line_text = ""
-                last_word_end_s = chunk_start_s
+                # Delay/fill schedule for the whole line in one vectorized
+                # call - the loop below only does string formatting
+                word_starts = np.fromiter((w['start'] for w in chunk['words']), dtype=np.float64, count=len(chunk['words']))
+                word_ends = np.fromiter((w['end'] for w in chunk['words']), dtype=np.float64, count=len(chunk['words']))
+                delays_cs, fills_cs, durations_ms = _swipeup_word_timings(word_starts, word_ends, chunk_start_s)
 
-                for word_info in chunk['words']:
+                line_parts = []
+
+                for word_idx, word_info in enumerate(chunk['words']):
                     word_text = word_info['word'].strip()
-                    word_start_s = word_info['start']
-                    word_end_s = word_info['end']
 
-                    delay_ms = max(0, (word_start_s - last_word_end_s) * 1000)
-                    word_duration_ms = max(10, (word_end_s - word_start_s) * 1000)
-                    
                     # Conditional animation for the word "JavaScript"
                     if 'javascript' in word_text.lower():
                         bounce_duration = 150
-                        animation_tags = fr"\k{int(delay_ms / 10)}\K{int(word_duration_ms / 10)}\t(0,{bounce_duration},\fscx125,\fscy125)\t({bounce_duration},{word_duration_ms},\fscx100,\fscy100)"
+                        animation_tags = fr"\k{delays_cs[word_idx]}\K{fills_cs[word_idx]}\t(0,{bounce_duration},\fscx125,\fscy125)\t({bounce_duration},{durations_ms[word_idx]},\fscx100,\fscy100)"
                     else:
                         # Standard karaoke effect for other words (no bounce)
-                        animation_tags = fr"\k{int(delay_ms / 10)}\K{int(word_duration_ms / 10)}"
-                    
-                    line_text += f"{{{animation_tags}}}{word_text} "
-                    
-                    last_word_end_s = word_end_s
+                        animation_tags = fr"\k{delays_cs[word_idx]}\K{fills_cs[word_idx]}"
 
-                event = self.create_ass_event(line_text.strip(), start_time, end_time, "Default", position)
+                    line_parts.append(f"{{{animation_tags}}}{word_text}")
+
+                event = self.create_ass_event(" ".join(line_parts), start_time, end_time, "Default", position)
                 events.append(event)
             
-        # Return ASS content directly
-        ass_content = ass_header + "\n".join(events)
-        return ass_content
-
-    def process_video_for_vertical(self, input_path: str, output_path: str, blur_strength: int = 10, layout_mode: str = "fit"):
+        if out_path is not None:
+            # Stream events straight into a buffered file: the full ASS
+            # string is never materialized, which matters for long
+            # transcripts with thousands of dialogue events
+            with open(out_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(ass_header)
+                for i, event in enumerate(events):
+                    if i:
+                        f.write("\n")
+                    f.write(event)
+            return out_path
+
+        # Assemble the ASS content in one buffer - no intermediate
+        # header + body concatenation
+        buf = io.StringIO()
+        buf.write(ass_header)
+        buf.write("\n".join(events))
+        return buf.getvalue()
+
+    def process_video_for_vertical(self, input_path: str, output_path: str, blur_strength: int = 10, layout_mode: str = "fit", hwaccel: str = "none"):
         """
         Processes a video to create a vertical version (1080x1920) with a blurred background
         using ffmpeg-python for robust and precise control.
         """
         try:
+            input_kwargs, vcodec = _resolve_hwaccel(hwaccel)
             probe = ffmpeg.probe(input_path)
             video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
             original_w = int(video_info['width'])
@@ -1720,7 +1863,7 @@ class OpusProcessor:
                 output_w = 1080
                 output_h = 1920
 
-            input_stream = ffmpeg.input(input_path)
+            input_stream = ffmpeg.input(input_path, **input_kwargs)
 
             split_streams = input_stream.video.split()
             stream1 = split_streams[0]
@@ -1833,10 +1976,71 @@ class OpusProcessor:
             )
 
             final_output = ffmpeg.output(
-                processed_video, 
-                input_stream.audio, 
-                output_path, 
-                vcodec='libx264', 
+                processed_video,
+                input_stream.audio,
+                output_path,
+                vcodec=vcodec,
+                acodec='aac',
+                shortest=None
+            )
+
+            final_output.overwrite_output().run(capture_stdout=True, capture_stderr=True)
+
+        except ffmpeg.Error as e:
+            print('FFmpeg Error:')
+            print(e.stderr.decode())
+            raise
+
+    def process_video_layout_and_burn_captions(self, input_path: str, ass_file: str, output_path: str, blur_strength: int = 10, layout_mode: str = "fit", hwaccel: str = "none"):
+        """
+        Fused layout + caption burn: one ffmpeg pass instead of two.
+
+        Builds the same vertical layout graph as process_video_for_vertical,
+        then chains the ass subtitle filter onto it so the video is decoded
+        and encoded exactly once, with no intermediate layout file.
+        """
+        try:
+            input_kwargs, vcodec = _resolve_hwaccel(hwaccel)
+            output_w = 1080
+            output_h = 1920
+
+            input_stream = ffmpeg.input(input_path, **input_kwargs)
+
+            split_streams = input_stream.video.split()
+            stream1 = split_streams[0]
+            stream2 = split_streams[1]
+
+            background = (
+                stream1
+                .filter('scale', w=-1, h=output_h)
+                .filter('crop', w=output_w, h=output_h)
+                .filter('boxblur', luma_radius=50, luma_power=5)
+            )
+
+            if layout_mode.lower() == "square":
+                foreground = stream2.filter('scale', w=1080, h=1200)
+                overlay_x = '(W-w)/2'
+                overlay_y = '(H-h)/2+150'
+            elif layout_mode.lower() == "fill":
+                foreground = stream2.filter('scale', w=output_w, h=output_h)
+                overlay_x = '0'
+                overlay_y = '0'
+            else:
+                # Fit mode: standard scaling
+                foreground = stream2.filter('scale', w=output_w, h=-1)
+                overlay_x = '(W-w)/2'
+                overlay_y = '(H-h)/2'
+
+            processed_video = (
+                ffmpeg.overlay(background, foreground, x=overlay_x, y=overlay_y)
+                .filter('ass', ass_file)
+            )
+
+            final_output = ffmpeg.output(
+                processed_video,
+                input_stream.audio,
+                output_path,
+                vcodec=vcodec,
                 acodec='aac',
                 shortest=None
             )
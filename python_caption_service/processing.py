@@ -206,7 +206,8 @@ def run_opus_transcription(
     timeframe_end=None,
     min_clip_length=30,
     max_clip_length=90,
-    target_clip_length=60
+    target_clip_length=60,
+    local_video_path=None
 ):
     """
     This is the main function that will be executed by the background worker.
@@ -224,6 +225,8 @@ def run_opus_transcription(
         min_clip_length: Minimum clip length in seconds (default: 30)
         max_clip_length: Maximum clip length in seconds (default: 90)
         target_clip_length: Target/preferred clip length in seconds (default: 60)
+        local_video_path: Already-downloaded video file; skips the yt-dlp
+            download so repeated runs on the same URL reuse bytes on disk
     """
 
     # Skip Replicate token check for local processing
@@ -234,9 +237,15 @@ def run_opus_transcription(
     processor = OpusProcessor()  # Create an instance of the processor
 
     try:
-        update_job_progress(5, "Downloading", f"Downloading video from {youtube_url}")
-        original_file_path, original_filename = download_youtube_video(youtube_url, temp_dir)
-        update_job_progress(15, "Download Complete", "YouTube video downloaded successfully")
+        if local_video_path:
+            original_file_path = local_video_path
+            if not original_filename:
+                original_filename = os.path.splitext(os.path.basename(local_video_path))[0]
+            update_job_progress(15, "Download Skipped", "Reusing prefetched local video")
+        else:
+            update_job_progress(5, "Downloading", f"Downloading video from {youtube_url}")
+            original_file_path, original_filename = download_youtube_video(youtube_url, temp_dir)
+            update_job_progress(15, "Download Complete", "YouTube video downloaded successfully")
 
         extracted_audio_path = os.path.join(temp_dir, "extracted_audio.wav")
         ass_file_path = os.path.join(temp_dir, "opus_subtitles.ass")
@@ -278,9 +287,24 @@ def run_opus_transcription(
         processed_video_path = original_file_path
         if layout_mode.lower() != "auto":
             update_job_progress(45, "Video Layout Processing", f"Processing video for {layout_mode} layout")
-            processed_video_path = os.path.join(temp_dir, f"layout_processed_{layout_mode}.mp4")
-            # Use the working OpusProcessor method instead of the broken one
-            processor.process_video_for_vertical(original_file_path, processed_video_path, blur_strength=10, layout_mode=layout_mode)
+            if local_video_path:
+                # Prefetched sources are shared across combination runs, so
+                # keep the layout intermediate next to the source and reuse
+                # it: the layout pass only depends on (source, layout) and
+                # costs a full ffmpeg spawn plus decode+encode per run
+                base_path, _ = os.path.splitext(original_file_path)
+                cached_layout_path = f"{base_path}.layout_{layout_mode.lower()}.mp4"
+                if not os.path.exists(cached_layout_path):
+                    partial_path = f"{cached_layout_path}.{os.getpid()}.part.mp4"
+                    processor.process_video_for_vertical(original_file_path, partial_path, blur_strength=10, layout_mode=layout_mode)
+                    os.replace(partial_path, cached_layout_path)
+                else:
+                    print(f"DEBUG: Reusing cached layout intermediate: {cached_layout_path}")
+                processed_video_path = cached_layout_path
+            else:
+                processed_video_path = os.path.join(temp_dir, f"layout_processed_{layout_mode}.mp4")
+                # Use the working OpusProcessor method instead of the broken one
+                processor.process_video_for_vertical(original_file_path, processed_video_path, blur_strength=10, layout_mode=layout_mode)
             update_job_progress(55, "Video Layout Complete", f"Video processed for {layout_mode} layout")
 
         video_w, video_h = get_video_dimensions(processed_video_path)
@@ -353,11 +377,10 @@ def run_opus_transcription(
             abs_final_export_path = os.path.abspath(final_export_path)
             abs_simple_ass_path = os.path.abspath(simple_ass_path)
             
-            # Use simple relative path approach for Windows compatibility
-            # Change to exports directory and use relative paths
-            original_cwd = os.getcwd()
-            os.chdir(exports_dir)
-            
+            # Use simple relative path approach for Windows compatibility:
+            # ffmpeg runs with cwd=exports_dir so the subtitle filter sees
+            # a bare filename, without mutating this process's directory
+
             ffmpeg_burn_command = [
                 'ffmpeg', '-y', 
                 '-i', processed_video_path,
@@ -377,7 +400,7 @@ def run_opus_transcription(
         
         print(f"Starting subtitle burning...")
         try:
-            result = subprocess.run(ffmpeg_burn_command, capture_output=True, text=True, check=True)
+            result = subprocess.run(ffmpeg_burn_command, capture_output=True, text=True, check=True, cwd=exports_dir)
             print(f"Subtitle burning completed successfully!")
             print(f"FFmpeg output: {result.stdout}")
             
@@ -411,7 +434,7 @@ def run_opus_transcription(
             print(f"Fallback command: {' '.join(fallback_command)}")
             
             try:
-                subprocess.run(fallback_command, capture_output=True, text=True, check=True)
+                subprocess.run(fallback_command, capture_output=True, text=True, check=True, cwd=exports_dir)
                 fallback_created = os.path.exists(abs_final_export_path)
                 print(f"Fallback video created: {fallback_created}")
                 update_job_progress(85, "Video Processing Complete", "Video processed (subtitles failed, video only)")
@@ -419,14 +442,6 @@ def run_opus_transcription(
                 print(f"Fallback also failed: {fallback_error}")
                 raise
         finally:
-            # Restore original working directory
-            try:
-                if 'original_cwd' in locals():
-                    os.chdir(original_cwd)
-                    print(f"DEBUG: Restored working directory to: {original_cwd}")
-            except:
-                pass
-            
             # Cleanup temporary ASS file
             try:
                 if 'simple_ass_path' in locals() and os.path.exists(simple_ass_path):
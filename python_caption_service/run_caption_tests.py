@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Run the three caption-burn tests in parallel.
+
+Each test spends nearly all its time inside one ffmpeg encode, and a
+single short-clip libx264 stream cannot saturate modern core counts -
+dispatching the tests across a process pool pushes total wall time
+toward the slowest single test instead of the sum of all three.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from test_subtitle_burning import test_subtitle_burning
+from test_swipeup_existing import test_swipeup_with_existing_video
+from test_tiktok_viral import test_tiktok_viral_captions
+
+CAPTION_TESTS = (
+    test_subtitle_burning,
+    test_swipeup_with_existing_video,
+    test_tiktok_viral_captions,
+)
+
+
+def main():
+    print("🚀 Running caption-burn tests in parallel...")
+    results = {}
+    with ProcessPoolExecutor(max_workers=len(CAPTION_TESTS)) as ex:
+        futures = {ex.submit(fn): fn.__name__ for fn in CAPTION_TESTS}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"❌ {name} raised: {e}")
+                results[name] = False
+
+    print("\n📊 Caption test results:")
+    for name, ok in sorted(results.items()):
+        print(f"   {'✅' if ok else '❌'} {name}")
+
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if main() else 1)
@@ -1,7 +1,30 @@
 import numpy as np
 import librosa
+import scipy.fftpack
+from functools import lru_cache
 from typing import List, Dict, Tuple
 
+@lru_cache(maxsize=None)
+def _mel_basis(sr: int, n_fft: int = 2048, n_mels: int = 128) -> np.ndarray:
+    """Mel filterbank, built once per (sr, n_fft, n_mels) and reused."""
+    return librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels)
+
+@lru_cache(maxsize=None)
+def _dct_basis(n_mfcc: int = 13, n_mels: int = 128) -> np.ndarray:
+    """Type-II orthonormal DCT basis, built once per (n_mfcc, n_mels)."""
+    return scipy.fftpack.dct(np.eye(n_mels), axis=0, type=2, norm='ortho')[:n_mfcc]
+
+def mfcc_fast(y: np.ndarray, sr: int, n_mfcc: int = 13, n_fft: int = 2048, hop_length: int = 512) -> np.ndarray:
+    """
+    MFCC extraction with cached filterbank/DCT basis.
+    librosa.feature.mfcc rebuilds the Mel filterbank and DCT basis on every
+    call, which dominates runtime when analyzing hundreds of short segments.
+    """
+    n_fft = min(n_fft, max(len(y), 1))
+    S = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length)) ** 2
+    log_mel = np.log(_mel_basis(sr, n_fft) @ S + 1e-10)
+    return _dct_basis(n_mfcc) @ log_mel
+
 def detect_speaker_changes_simple(audio_path: str, word_segments: List[Dict], threshold: float = 0.65) -> List[Dict]:
     """
     Voice-based speaker detection using MFCC clustering.
@@ -30,7 +53,7 @@ def detect_speaker_changes_simple(audio_path: str, word_segments: List[Dict], th
                 segment_audio = y[start_sample:end_sample]
                 
                 # Extract MFCC features
-                mfccs = librosa.feature.mfcc(y=segment_audio, sr=sr, n_mfcc=13)
+                mfccs = mfcc_fast(segment_audio, sr, n_mfcc=13)
                 feature_vector = np.mean(mfccs, axis=1)
                 
                 features_list.append(feature_vector)
@@ -78,7 +101,7 @@ def detect_speaker_changes_mfcc(audio_path: str, word_segments: List[Dict], thre
         y, sr = librosa.load(audio_path, sr=16000)
         
         # Extract MFCC features (commonly used for speaker recognition)
-        mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13, hop_length=512)
+        mfccs = mfcc_fast(y, sr, n_mfcc=13, hop_length=512)
         
         # Calculate frame times
         frame_times = librosa.frames_to_time(np.arange(mfccs.shape[1]), sr=sr, hop_length=512)
@@ -138,28 +161,24 @@ def create_fallback_speaker_segments(segments: List[Dict]) -> List[Dict]:
     Create fake speaker segments based on pauses in speech.
     Assumes speaker changes happen during longer pauses.
     """
-    speaker_segments = []
-    current_speaker = 0
-    
-    for i, segment in enumerate(segments):
-        # Check for long pause before this segment
-        if i > 0:
-            prev_end = segments[i-1]['end']
-            current_start = segment['start']
-            pause_duration = current_start - prev_end
-            
-            # If there's a gap > 0.5 second, assume speaker change
-            if pause_duration > 0.5:
-                current_speaker += 1
-                print(f"Speaker change detected at pause: {current_start:.2f}s (pause: {pause_duration:.2f}s)")
-        
-        speaker_segments.append({
-            'start': segment['start'],
-            'end': segment['end'],
-            'speaker': f'SPEAKER_{current_speaker:02d}'
-        })
-    
-    return speaker_segments
+    if not segments:
+        return []
+
+    # Compute all inter-segment pauses in one vectorized pass instead of a
+    # per-word Python loop; speaker IDs are the running count of gaps > 0.5s.
+    starts = np.fromiter((s['start'] for s in segments), dtype=np.float64, count=len(segments))
+    ends = np.fromiter((s['end'] for s in segments), dtype=np.float64, count=len(segments))
+    pauses = np.concatenate(([0.0], starts[1:] - ends[:-1]))
+    is_change = pauses > 0.5
+    speaker_ids = np.cumsum(is_change)
+
+    for i in np.flatnonzero(is_change):
+        print(f"Speaker change detected at pause: {starts[i]:.2f}s (pause: {pauses[i]:.2f}s)")
+
+    return [
+        {'start': start, 'end': end, 'speaker': f'SPEAKER_{speaker_id:02d}'}
+        for start, end, speaker_id in zip(starts.tolist(), ends.tolist(), speaker_ids.tolist())
+    ]
 
 def assign_speaker_colors_simple(speaker_segments: List[Dict]) -> Dict[str, str]:
     """
@@ -178,18 +197,20 @@ def detect_speaker_change_points(word_segments: List[Dict], min_pause: float = 1
     """
     Detect potential speaker change points based on significant pauses.
     """
-    change_points = [0.0]  # Always start with beginning
-    
-    for i in range(1, len(word_segments)):
-        prev_end = word_segments[i-1]['end']
-        current_start = word_segments[i]['start']
-        pause_duration = current_start - prev_end
-        
-        if pause_duration > min_pause:
-            change_points.append(current_start)
-            print(f"Speaker change point at {current_start:.2f}s (pause: {pause_duration:.2f}s)")
-    
-    return change_points
+    if len(word_segments) < 2:
+        return [0.0]
+
+    # Vectorized pause detection: one np.diff-style pass over the
+    # pre-extracted start/end arrays instead of a per-word Python loop.
+    starts = np.fromiter((w['start'] for w in word_segments), dtype=np.float64, count=len(word_segments))
+    ends = np.fromiter((w['end'] for w in word_segments), dtype=np.float64, count=len(word_segments))
+    pauses = starts[1:] - ends[:-1]
+    change_indices = np.where(pauses > min_pause)[0]
+
+    for i in change_indices:
+        print(f"Speaker change point at {starts[i + 1]:.2f}s (pause: {pauses[i]:.2f}s)")
+
+    return [0.0] + starts[change_indices + 1].tolist()  # Always start with beginning
 
 def extract_segment_features(audio_path: str, word_segments: List[Dict], change_points: List[float]) -> List[Dict]:
     """
@@ -210,7 +231,7 @@ def extract_segment_features(audio_path: str, word_segments: List[Dict], change_
             
             if len(segment_audio) > 0:
                 # Extract MFCC features
-                mfccs = librosa.feature.mfcc(y=segment_audio, sr=sr, n_mfcc=13)
+                mfccs = mfcc_fast(segment_audio, sr, n_mfcc=13)
                 feature_vector = np.mean(mfccs, axis=1)  # Average across time
                 
                 segments_with_features.append({
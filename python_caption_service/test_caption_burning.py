@@ -3,9 +3,31 @@
 Test script to verify caption burning works
 """
 
+import collections
 import os
+import shutil
 import subprocess
 import tempfile
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def pick_h264_encoder():
+    """
+    Pick the fastest available H.264 encoder, probing ffmpeg once.
+    Hardware encoders (NVENC/QSV/VideoToolbox) are typically 5-10x faster
+    than libx264 for test throughput.
+    """
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True, text=True
+        )
+        for encoder in ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox'):
+            if encoder in result.stdout:
+                return encoder
+    except FileNotFoundError:
+        pass
+    return 'libx264'
 
 def test_caption_burning():
     """Test if caption burning works with a simple video"""
@@ -33,12 +55,18 @@ Dialogue: 0,0:00:15.00,0:00:20.00,Default,,0,0,0,,CAPTION BURNING SUCCESS!
         with open(ass_path, 'w', encoding='utf-8') as f:
             f.write(ass_content)
         
-        # Check if we have any existing video files to test with
+        # Check if we have any existing video files to test with.
+        # scandir stops at the first .mp4 instead of building and filtering
+        # the full directory listing.
         clips_dir = "exports/clips"
         if os.path.exists(clips_dir):
-            video_files = [f for f in os.listdir(clips_dir) if f.endswith('.mp4')]
-            if video_files:
-                input_video = os.path.join(clips_dir, video_files[0])
+            input_video = None
+            with os.scandir(clips_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith('.mp4'):
+                        input_video = entry.path
+                        break
+            if input_video:
                 output_video = os.path.join(clips_dir, "test_with_captions.mp4")
                 
                 print(f"🧪 Testing caption burning...")
@@ -50,36 +78,57 @@ Dialogue: 0,0:00:15.00,0:00:20.00,Default,,0,0,0,,CAPTION BURNING SUCCESS!
                 original_cwd = os.getcwd()
                 os.chdir(temp_dir)
                 
-                # Copy ASS file with simple name
+                # Copy ASS file with simple name: hard link when possible
+                # (zero bytes copied), else kernel-side sendfile copy -
+                # either way no Python-level decode/encode round-trip
                 simple_ass_path = os.path.join(temp_dir, "captions.ass")
-                with open(ass_path, 'r', encoding='utf-8') as src:
-                    with open(simple_ass_path, 'w', encoding='utf-8') as dst:
-                        dst.write(src.read())
+                try:
+                    os.link(ass_path, simple_ass_path)
+                except OSError:
+                    shutil.copyfile(ass_path, simple_ass_path)
                 
-                # FFmpeg command with ass filter
+                # FFmpeg command with ass filter; hardware encode when
+                # available, otherwise speed-tuned libx264
+                encoder = pick_h264_encoder()
+                if encoder == 'libx264':
+                    encoder_args = ['-c:v', 'libx264', '-crf', '23',
+                                    '-preset', 'ultrafast', '-tune', 'fastdecode',
+                                    '-threads', '0']
+                else:
+                    encoder_args = ['-c:v', encoder]
+
                 ffmpeg_cmd = [
                     'ffmpeg', '-y',
                     '-i', os.path.abspath(input_video),
                     '-vf', 'ass=captions.ass',
-                    '-c:v', 'libx264', '-crf', '23', '-preset', 'fast',
+                    *encoder_args,
                     '-c:a', 'copy',
+                    '-movflags', '+faststart',
                     os.path.abspath(output_video)
                 ]
                 
                 print(f"   📋 FFmpeg command: {' '.join(ffmpeg_cmd)}")
                 
-                result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True, cwd=temp_dir)
-                
+                # Stream stderr through a bounded ring buffer - keeps the
+                # last 200 lines for diagnostics instead of buffering the
+                # whole encode log in memory
+                proc = subprocess.Popen(
+                    ffmpeg_cmd, stderr=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL, text=True, cwd=temp_dir
+                )
+                stderr_tail = collections.deque(proc.stderr, maxlen=200)
+                returncode = proc.wait()
+
                 # Restore directory
                 os.chdir(original_cwd)
-                
-                if result.returncode == 0:
+
+                if returncode == 0:
                     print(f"   ✅ Caption burning test successful!")
                     print(f"   📁 Output file: {output_video}")
                     return True
                 else:
                     print(f"   ❌ Caption burning test failed!")
-                    print(f"   📋 FFmpeg stderr: {result.stderr}")
+                    print(f"   📋 FFmpeg stderr (last 200 lines): {''.join(stderr_tail)}")
                     return False
             else:
                 print("❌ No video files found in exports/clips to test with")
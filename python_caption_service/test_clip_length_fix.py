@@ -4,12 +4,22 @@ Test that the clip length fix works correctly
 Verify clips are now in the 60-90s range instead of 30s
 """
 
+import sys
+
+import numpy as np
+
 from hook_detector import HookDetector, TranscriptSegment
 
+# Precompiled once; the per-clip report is rendered into a list and written
+# with a single stdout call instead of several prints per clip
+CLIP_REPORT_TEMPLATE = (
+    "Clip #{i}: {d:.1f}s {mark}\n"
+    "   Start: {s:.1f}s → End: {e:.1f}s\n"
+    "   Text: {t}...\n"
+)
+
 def create_long_transcript():
     """Create a 5-minute mock transcript"""
-    segments = []
-    
     # Create segments every 5-7 seconds for 5 minutes (300 seconds)
     sentences = [
         "Welcome to this amazing video about content creation.",
@@ -76,18 +86,16 @@ def create_long_transcript():
         "Thank you so much for watching this entire video today.",
     ]
     
-    current_time = 0.0
-    for i, sentence in enumerate(sentences):
-        duration = 5.0 + (i % 3)  # Vary between 5-7 seconds
-        segment = TranscriptSegment(
-            start_time=current_time,
-            end_time=current_time + duration,
-            text=sentence
-        )
-        segments.append(segment)
-        current_time += duration
-    
-    return segments
+    # Vary between 5-7 seconds; all timing computed in one vectorized pass
+    # so this scales to 10k+ segment stress tests
+    durations = 5.0 + (np.arange(len(sentences)) % 3).astype(np.float64)
+    ends = np.cumsum(durations)
+    starts = ends - durations
+
+    return [
+        TranscriptSegment(start_time=start, end_time=end, text=sentence)
+        for start, end, sentence in zip(starts.tolist(), ends.tolist(), sentences)
+    ]
 
 def test_clip_lengths():
     """Test that clips are now in the 60-90s range"""
@@ -107,13 +115,16 @@ def test_clip_lengths():
     
     print(f"✅ Generated {len(clips)} clips\n")
     
-    for i, clip in enumerate(clips, 1):
-        duration = clip.duration
-        in_range = "✅" if 60 <= duration <= 90 else "❌"
-        print(f"Clip #{i}: {duration:.1f}s {in_range}")
-        print(f"   Start: {clip.start_time:.1f}s → End: {clip.end_time:.1f}s")
-        print(f"   Text: {clip.transcript[:80]}...")
-        print()
+    lines = [
+        CLIP_REPORT_TEMPLATE.format(
+            i=i, d=clip.duration,
+            mark='✅' if 60 <= clip.duration <= 90 else '❌',
+            s=clip.start_time, e=clip.end_time,
+            t=clip.transcript[:80]
+        )
+        for i, clip in enumerate(clips, 1)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Calculate statistics
     durations = [clip.duration for clip in clips]
@@ -29,7 +29,11 @@ def test_complete_pipeline():
     print(f"   Duration: {data['clip_duration']}s")
     print()
 
-    response = requests.post(url, data=data)
+    # One pooled connection for the submit and every status poll; avoids a
+    # fresh TCP handshake + connection setup per request
+    session = requests.Session()
+
+    response = session.post(url, data=data)
     
     if response.status_code == 200:
         job_data = response.json()
@@ -41,7 +45,7 @@ def test_complete_pipeline():
         
         while True:
             try:
-                status_response = requests.get(status_url)
+                status_response = session.get(status_url)
                 status_data = status_response.json()
                 
                 # The API returns data under 'job' key
@@ -7,9 +7,10 @@ This generates the final video with both video processing and captions.
 import os
 import sys
 import argparse
-from opus_processor import OpusProcessor
+import pytest
+from test_helpers import get_processor
 
-def test_complete_video(input_video, layout_mode, template_name, output_video=None):
+def run_complete_video(input_video, layout_mode, template_name, output_video=None, hwaccel="none"):
     """Test complete video processing with layout and captions."""
     
     if not os.path.exists(input_video):
@@ -26,29 +27,23 @@ def test_complete_video(input_video, layout_mode, template_name, output_video=No
     print(f"Output: {output_video}")
     
     try:
-        processor = OpusProcessor()
-        
-        # Step 1: Process video with layout
-        layout_video = f"temp_{layout_mode}_layout.mp4"
-        print(f"\n🎬 Step 1: Processing video layout...")
-        processor.process_video_for_vertical(input_video, layout_video, layout_mode=layout_mode)
-        print(f"✅ Layout video created: {layout_video}")
-        
-        # Step 2: Generate captions
-        print(f"\n📝 Step 2: Generating captions...")
+        processor = get_processor()
+
+        # Step 1: Generate captions
+        print(f"\n📝 Step 1: Generating captions...")
         segments = processor.transcribe_audio(input_video)
         caption_file = processor.generate_karaoke_captions(segments, template_name, layout_mode=layout_mode)
         print(f"✅ Captions generated: {caption_file}")
-        
-        # Step 3: Combine video and captions
-        print(f"\n🎯 Step 3: Combining video and captions...")
-        processor.combine_video_with_captions(layout_video, caption_file, output_video)
+
+        # Step 2: Layout + caption burn fused into a single ffmpeg pass -
+        # one decode/encode instead of two, and no temp layout file
+        print(f"\n🎯 Step 2: Processing layout and burning captions...")
+        processor.process_video_layout_and_burn_captions(
+            input_video, caption_file, output_video, layout_mode=layout_mode,
+            hwaccel=hwaccel
+        )
         print(f"✅ Complete video created: {output_video}")
-        
-        # Cleanup temp files
-        if os.path.exists(layout_video):
-            os.remove(layout_video)
-            
+
         print(f"\n🎉 SUCCESS! Complete video with {layout_mode} layout and {template_name} captions saved: {output_video}")
         print(f"📱 Video format: 1080x1920 (vertical)")
         print(f"🎬 Layout: {layout_mode.title()} mode")
@@ -60,6 +55,10 @@ def test_complete_video(input_video, layout_mode, template_name, output_video=No
         print(f"❌ Error during complete video processing: {e}")
         return False
 
+@pytest.mark.skipif(not os.path.exists("podcast.mp4"), reason="sample video not present")
+def test_complete_video():
+    assert run_complete_video("podcast.mp4", "fit", "BeastMode")
+
 def main():
     parser = argparse.ArgumentParser(description='Test complete video processing with layout and captions')
     parser.add_argument('input_video', help='Input video file')
@@ -68,10 +67,12 @@ def main():
     parser.add_argument('--template', default='BeastMode',
                        help='Caption template (default: BeastMode)')
     parser.add_argument('--output', help='Output video file (optional)')
+    parser.add_argument('--hwaccel', choices=['none', 'cuda', 'qsv', 'videotoolbox'], default='none',
+                       help='Hardware decode/encode backend (falls back to CPU if unavailable)')
     
     args = parser.parse_args()
     
-    success = test_complete_video(args.input_video, args.layout, args.template, args.output)
+    success = run_complete_video(args.input_video, args.layout, args.template, args.output, hwaccel=args.hwaccel)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
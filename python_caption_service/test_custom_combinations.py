@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 
 import os
+import shutil
 import sys
 import tempfile
 import subprocess
-from processing import run_opus_transcription
+import pytest
+from processing import run_opus_transcription, download_youtube_video
 
+@pytest.mark.network
 def test_custom_combinations():
     """Test specific template-layout combinations as requested"""
     
@@ -25,6 +28,16 @@ def test_custom_combinations():
     print(f"📺 Video: {youtube_url}")
     print(f"⏱️  Duration: {clip_duration}s")
     print()
+
+    # Download the source once; all four combinations reuse the same file
+    cache_dir = tempfile.mkdtemp(prefix="combo_test_cache_")
+    print("⬇️  Prefetching video once for all combinations...")
+    try:
+        cached_path, cached_name = download_youtube_video(youtube_url, cache_dir)
+    except Exception as e:
+        print(f"⚠️  Prefetch failed ({e}); each run will download on its own")
+        cached_path, cached_name = None, None
+
     
     for i, combo in enumerate(combinations, 1):
         layout = combo["layout"]
@@ -40,7 +53,9 @@ def test_custom_combinations():
                 opus_template=template,
                 clip_duration=clip_duration,
                 exports_dir=exports_dir,
-                layout_mode=layout
+                layout_mode=layout,
+                local_video_path=cached_path,
+                original_filename=cached_name
             )
             
             if result and len(result) > 0:
@@ -55,6 +70,8 @@ def test_custom_combinations():
         
         print("-" * 60)
     
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
     print("\n🎉 Custom combination testing completed!")
     print("\n📋 Generated videos:")
     print("   1. Fit + Karaoke → Blurred background with karaoke-style captions")
@@ -1,51 +1,85 @@
 #!/usr/bin/env python3
 
 import os
+import shutil
 import sys
 import tempfile
 import subprocess
-from processing import run_opus_transcription
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pytest
+from processing import run_opus_transcription, download_youtube_video
 
+YOUTUBE_URL = "https://www.youtube.com/watch?v=ZzI9JE0i6Lc"
+EXPORTS_DIR = "exports"
+CLIP_DURATION = 30  # Short clips for quick testing
+
+def _run_one(combo, local_video_path=None, original_filename=None):
+    """Run a single template/layout combination; top-level so it pickles for the pool."""
+    template, layout = combo
+    try:
+        result = run_opus_transcription(
+            youtube_url=YOUTUBE_URL,
+            opus_template=template,
+            clip_duration=CLIP_DURATION,
+            exports_dir=EXPORTS_DIR,
+            layout_mode=layout,
+            local_video_path=local_video_path,
+            original_filename=original_filename
+        )
+        return template, layout, result, None
+    except Exception as e:
+        return template, layout, None, str(e)
+
+@pytest.mark.network
 def test_templates_and_layouts():
     """Test different caption templates and layout modes"""
-    
+
     # Available templates and layouts to test
     templates = ["SwipeUp", "Bounce", "Fade", "Slide"]  # Add more as needed
     layouts = ["fit", "square", "fill"]
-    
-    youtube_url = "https://www.youtube.com/watch?v=ZzI9JE0i6Lc"
-    exports_dir = "exports"
-    clip_duration = 30  # Short clips for quick testing
-    
+
     print("🎬 Testing different caption templates and layouts...")
-    print(f"📺 Video: {youtube_url}")
-    print(f"⏱️  Duration: {clip_duration}s")
+    print(f"📺 Video: {YOUTUBE_URL}")
+    print(f"⏱️  Duration: {CLIP_DURATION}s")
     print()
-    
-    for template in templates:
-        for layout in layouts:
-            print(f"🚀 Testing: {template} template with {layout} layout")
-            
-            try:
-                result = run_opus_transcription(
-                    youtube_url=youtube_url,
-                    opus_template=template,
-                    clip_duration=clip_duration,
-                    exports_dir=exports_dir,
-                    layout_mode=layout
-                )
-                
-                if result and len(result) > 0:
-                    output_file = result[0].get('previewUrl', '').replace('/exports/', '')
-                    print(f"✅ Success: {output_file}")
-                else:
-                    print(f"❌ Failed: No output generated")
-                    
-            except Exception as e:
-                print(f"❌ Error: {str(e)}")
-            
+
+    # The combinations are independent, so run them across cores; each
+    # worker owns its own download + ffmpeg pipeline
+    combos = [(t, l) for t in templates for l in layouts]
+    max_workers = min(len(combos), os.cpu_count() or 1)
+
+    # Download the source once; every combination reuses the same bytes on
+    # disk instead of paying for its own yt-dlp fetch
+    cache_dir = tempfile.mkdtemp(prefix="template_test_cache_")
+    print("⬇️  Prefetching video once for all combinations...")
+    try:
+        cached_path, cached_name = download_youtube_video(YOUTUBE_URL, cache_dir)
+    except Exception as e:
+        print(f"⚠️  Prefetch failed ({e}); each run will download on its own")
+        cached_path, cached_name = None, None
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_run_one, combo, cached_path, cached_name): combo
+            for combo in combos
+        }
+
+        for future in as_completed(futures):
+            template, layout, result, error = future.result()
+            print(f"🚀 Tested: {template} template with {layout} layout")
+
+            if error:
+                print(f"❌ Error: {error}")
+            elif result and len(result) > 0:
+                output_file = result[0].get('previewUrl', '').replace('/exports/', '')
+                print(f"✅ Success: {output_file}")
+            else:
+                print(f"❌ Failed: No output generated")
+
             print("-" * 50)
-    
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
     print("\n🎉 Template testing completed!")
     print("Check the exports/ directory for all generated videos")
 
@@ -8,48 +8,52 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from types import MappingProxyType
+
 from processing import run_opus_transcription
 
+TEMPLATE_NAME = "Karaoke"  # Template to use
+
+# Built once at import and passed by reference - run_opus_transcription
+# only reads it, so a fresh dict per call buys nothing
+DEFAULT_OPUS_TEMPLATE = MappingProxyType({
+    "name": TEMPLATE_NAME,
+    "displayName": TEMPLATE_NAME,
+    "description": "",
+    "category": "General",
+    "wordsPerLine": 3,
+    "positions": ["bottom_center"],
+    "animationStyle": "bounce",
+    "syncMode": "word",
+    "fontFamily": "Arial",
+    "fontSize": 48,
+    "fontColor": "#FFFFFF",
+    "shadowColor": "#000000",
+    "shadowX": 2,
+    "shadowY": 2,
+    "shadowBlur": 3,
+    "position": "bottom",
+    "keywordHighlight": {
+        "primaryColor": "#04f827FF",
+        "secondaryColor": "#FFFDO3FF",
+        "enabled": True
+    }
+})
+
 def test_direct_processing():
     """Test the processing pipeline directly without RQ"""
-    
+
     # Test parameters
     youtube_url = "https://youtu.be/ZzI9JE0i6Lc?si=HlRIsl33oQPHpaCU"
-    
+
     layout_mode = "fit"  # Options: "fit", "square", "fill", "auto"
-    template_name = "Karaoke"  # Template to use
-    
-    opus_template = {
-        "name": template_name,
-        "displayName": template_name, 
-        "description": "",
-        "category": "General",
-        "wordsPerLine": 3,
-        "positions": ["bottom_center"],
-        "animationStyle": "bounce",
-        "syncMode": "word",
-        "fontFamily": "Arial",
-        "fontSize": 48,
-        "fontColor": "#FFFFFF",
-        "shadowColor": "#000000",
-        "shadowX": 2,
-        "shadowY": 2,
-        "shadowBlur": 3,
-        "position": "bottom",
-        "keywordHighlight": {
-            "primaryColor": "#04f827FF",
-            "secondaryColor": "#FFFDO3FF",
-            "enabled": True
-        }
-    }
-    
+
     clip_duration = 30
     exports_dir = r"C:\dev\opusclip-project\python_caption_service\exports"
-    layout_mode = "fit"
-    
+
     print("🚀 Testing direct processing with:")
     print(f"   Layout: {layout_mode}")
-    print(f"   Template: {opus_template['name']}")
+    print(f"   Template: {DEFAULT_OPUS_TEMPLATE['name']}")
     print(f"   Duration: {clip_duration}s")
     print()
     
@@ -57,7 +61,7 @@ def test_direct_processing():
         # Run processing directly
         result = run_opus_transcription(
             youtube_url=youtube_url,
-            opus_template=opus_template,
+            opus_template=DEFAULT_OPUS_TEMPLATE,
             clip_duration=clip_duration,
             exports_dir=exports_dir,
             original_filename=None,
@@ -4,27 +4,26 @@ Test Glitch captions in isolation to debug the issue
 """
 
 import os
-from opus_processor import OpusProcessor
+import numpy as np
+from test_helpers import get_processor
+
+def run_glitch_captions():
+    """Generate Glitch captions in isolation and report success"""
 
-def test_glitch_captions():
-    """Test Glitch captions generation in isolation"""
-    
     print("🔧 Testing Glitch captions in isolation...")
-    
-    # Create test segments (simulating word-level segments)
-    test_segments = [
-        {'text': 'This', 'start': 0.0, 'end': 0.5},
-        {'text': 'is', 'start': 0.5, 'end': 0.8},
-        {'text': 'a', 'start': 0.8, 'end': 1.0},
-        {'text': 'glitch', 'start': 1.0, 'end': 1.5},
-        {'text': 'test', 'start': 1.5, 'end': 2.0},
-        {'text': 'with', 'start': 2.0, 'end': 2.3},
-        {'text': 'digital', 'start': 2.3, 'end': 2.8},
-        {'text': 'effects', 'start': 2.8, 'end': 3.5}
-    ]
+
+    # Create test segments (simulating word-level segments) as a
+    # structured array - one column per field instead of a dict per word
+    words = ['This', 'is', 'a', 'glitch', 'test', 'with', 'digital', 'effects']
+    starts = [0.0, 0.5, 0.8, 1.0, 1.5, 2.0, 2.3, 2.8]
+    ends = [0.5, 0.8, 1.0, 1.5, 2.0, 2.3, 2.8, 3.5]
+    test_segments = np.zeros(len(words), dtype=[('start', 'f4'), ('end', 'f4'), ('text', 'O')])
+    test_segments['start'] = starts
+    test_segments['end'] = ends
+    test_segments['text'] = words
     
     # Initialize OpusProcessor
-    processor = OpusProcessor()
+    processor = get_processor()
     
     # Generate Glitch captions
     print("📝 Generating Glitch captions...")
@@ -33,13 +32,13 @@ def test_glitch_captions():
         print(f"   {i+1}: '{seg['text']}' ({seg['start']:.1f}s - {seg['end']:.1f}s)")
     
     try:
-        ass_content = processor.generate_karaoke_captions(test_segments, "Glitch")
-        
-        # Save to debug file
+        # Stream the events straight into the debug file instead of
+        # materializing the full ASS string first
         debug_file = "debug_glitch_captions.ass"
-        with open(debug_file, 'w', encoding='utf-8') as f:
-            f.write(ass_content)
-        
+        processor.generate_karaoke_captions(test_segments, "Glitch", out_path=debug_file)
+        with open(debug_file, encoding='utf-8') as f:
+            ass_content = f.read()
+
         print(f"✅ Glitch captions generated!")
         print(f"📋 ASS file saved to: {debug_file}")
         print(f"📋 ASS content length: {len(ass_content)} characters")
@@ -66,5 +65,8 @@ def test_glitch_captions():
         traceback.print_exc()
         return False
 
+def test_glitch_captions():
+    assert run_glitch_captions()
+
 if __name__ == "__main__":
-    test_glitch_captions()
+    run_glitch_captions()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the test scripts.
+"""
+
+import atexit
+import os
+import shutil
+import subprocess
+import tempfile
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_processor():
+    """Return a shared OpusProcessor so tests in one session reuse the
+    same instance instead of repeating its cold-start setup."""
+    # Imported lazily so modules that only need the encoder helper don't
+    # pay for the processor's import chain
+    from opus_processor import OpusProcessor
+    return OpusProcessor()
+
+
+@lru_cache(maxsize=1)
+def get_test_tmpdir() -> str:
+    """
+    One scratch directory shared by the whole test session (in tmpfs
+    when /dev/shm exists), cleaned up at interpreter exit. Tests create
+    uniquely named files or subdirectories inside it instead of paying
+    a mkdir/rmtree round-trip each.
+    """
+    base = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    tmp = tempfile.mkdtemp(prefix='caption_tests_', dir=base)
+    atexit.register(shutil.rmtree, tmp, ignore_errors=True)
+    return tmp
+
+
+@lru_cache(maxsize=1)
+def ffmpeg_encoder_args() -> tuple:
+    """
+    H.264 encoder arguments for ffmpeg burn commands, preferring a
+    hardware encoder when this ffmpeg build exposes one. Decoding and
+    the ass filter stay on the CPU either way, so only the encoder leg
+    moves to silicon.
+    """
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True)
+        encoders = result.stdout
+    except OSError:
+        encoders = ''
+    if 'h264_nvenc' in encoders:
+        return ('-c:v', 'h264_nvenc', '-preset', 'p4', '-rc', 'vbr', '-cq', '23')
+    if 'h264_videotoolbox' in encoders:
+        return ('-c:v', 'h264_videotoolbox', '-q:v', '55')
+    return ('-c:v', 'libx264', '-crf', '23', '-preset', 'fast')
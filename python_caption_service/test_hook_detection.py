@@ -3,12 +3,16 @@ Test Script for Hook Detection System
 Tests viral clip detection and scoring
 """
 
+import contextlib
+import io
 import json
+import sys
+import pytest
 from hook_detector import HookDetector, parse_whisper_segments
 from clip_processor import ClipProcessor
 
 
-def test_hook_detection():
+def run_hook_detection():
     """Test basic hook detection functionality"""
     print("🧪 Testing Hook Detection System")
     print("=" * 50)
@@ -44,7 +48,13 @@ def test_hook_detection():
     
     # Convert to segments
     segments = parse_whisper_segments(sample_transcript)
-    
+
+    # Vectorized scoring pass: one score per candidate clip
+    candidate_clips = detector.segment_transcript(segments)
+    scores = detector.score_segments(candidate_clips)
+    assert scores.shape == (len(candidate_clips),), "expected one score per clip"
+    print(f"   Scored {len(candidate_clips)} candidate clips (max score: {scores.max():.2f})")
+
     # Find viral clips
     viral_clips = detector.find_viral_clips(segments, top_n=5)
     
@@ -61,7 +71,7 @@ def test_hook_detection():
     return viral_clips
 
 
-def test_clip_processor():
+def run_clip_processor():
     """Test the integrated clip processor"""
     print("\n\n🧪 Testing Clip Processor Integration")
     print("=" * 50)
@@ -106,7 +116,7 @@ def test_clip_processor():
         return []
 
 
-def test_scoring_algorithm():
+def run_scoring_algorithm():
     """Test individual scoring components"""
     print("\n\n🧪 Testing Scoring Algorithm Components")
     print("=" * 50)
@@ -142,7 +152,11 @@ def test_scoring_algorithm():
     ]
     
     print("🔍 Testing scoring components:")
-    
+
+    # The keyword matcher (Hyperscan DB / automaton / regex) is compiled
+    # once at init and must be reused across calls, not rebuilt
+    matcher_before = detector._kw_hs_db or detector._kw_automaton or detector._kw_regex
+
     for i, test in enumerate(test_cases):
         print(f"\n📝 Test Case {i+1}: {test['description']}")
         print(f"   Text: \"{test['text']}\"")
@@ -164,35 +178,77 @@ def test_scoring_algorithm():
         
         print(f"   Partial Score: {total_score:.1f} (keywords: {keyword_score}, question: {question_score})")
 
+    matcher_after = detector._kw_hs_db or detector._kw_automaton or detector._kw_regex
+    assert matcher_after is matcher_before, "keyword matcher was rebuilt between calls"
+
+
+@pytest.mark.network
+def test_hook_detection():
+    viral_clips = run_hook_detection()
+    assert viral_clips, "expected at least one viral clip"
+
+
+@pytest.mark.network
+def test_clip_processor():
+    run_clip_processor()
+
+
+def test_scoring_algorithm():
+    run_scoring_algorithm()
+
+
+def test_keyword_matcher_parity():
+    """The compiled matcher must agree with a naive per-keyword scan."""
+    detector = HookDetector()
+    samples = [
+        "What is the secret nobody told you about making money?",
+        "This is the biggest mistake entrepreneurs make when starting.",
+        "Today we're going to learn about basic accounting principles.",
+        "You won't believe this crazy technique that will shock you!",
+        "",
+    ]
+    for text in samples:
+        text_lower = text.lower()
+        naive = [kw for kw in detector.HOOK_KEYWORDS if kw in text_lower]
+        assert detector._detect_hook_keywords(text) == naive, f"mismatch on: {text!r}"
+
 
 def run_comprehensive_test():
     """Run all tests"""
-    print("🚀 Starting Comprehensive Hook Detection Tests")
-    print("=" * 60)
-    
+    # The suite emits a few hundred prints; buffer them and hand stdout
+    # one big write instead of a write+flush per line
+    buf = io.StringIO()
     try:
-        # Test 1: Basic hook detection
-        viral_clips = test_hook_detection()
-        
-        # Test 2: Clip processor integration
-        processed_clips = test_clip_processor()
-        
-        # Test 3: Scoring algorithm components
-        test_scoring_algorithm()
-        
-        print("\n" + "=" * 60)
-        print("✅ All Tests Completed Successfully!")
-        print(f"   Hook Detection: {len(viral_clips)} clips found")
-        print(f"   Clip Processor: {len(processed_clips)} clips processed")
-        print("   Scoring Algorithm: All components working")
-        
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Test Suite Failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        with contextlib.redirect_stdout(buf):
+            print("🚀 Starting Comprehensive Hook Detection Tests")
+            print("=" * 60)
+
+            try:
+                # Test 1: Basic hook detection
+                viral_clips = run_hook_detection()
+
+                # Test 2: Clip processor integration
+                processed_clips = run_clip_processor()
+
+                # Test 3: Scoring algorithm components
+                run_scoring_algorithm()
+
+                print("\n" + "=" * 60)
+                print("✅ All Tests Completed Successfully!")
+                print(f"   Hook Detection: {len(viral_clips)} clips found")
+                print(f"   Clip Processor: {len(processed_clips)} clips processed")
+                print("   Scoring Algorithm: All components working")
+
+                return True
+
+            except Exception as e:
+                print(f"\n❌ Test Suite Failed: {e}")
+                import traceback
+                traceback.print_exc(file=sys.stdout)
+                return False
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,12 @@ import tempfile
 import subprocess
 from processing import process_video_for_layout, download_youtube_video
 
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
 def test_layout_processing():
     """Test just the layout processing step in isolation"""
     
@@ -14,57 +20,61 @@ def test_layout_processing():
     # Use the same YouTube URL
     youtube_url = "https://www.youtube.com/watch?v=ZzI9JE0i6Lc"
     
+    # Write the layout output straight into exports/ - no temp file plus
+    # copy, which would re-read and re-write the whole video
+    exports_dir = "exports"
+    os.makedirs(exports_dir, exist_ok=True)
+
     with tempfile.TemporaryDirectory() as temp_dir:
         print(f"📁 Working in: {temp_dir}")
-        
+
         # Download original video
         print("⬇️ Downloading original video...")
         original_file_path, original_filename = download_youtube_video(youtube_url, temp_dir)
         print(f"✅ Downloaded: {original_file_path}")
-        
+
         # Test layout processing
         print("🎨 Testing 'fit' layout processing...")
-        layout_output_path = os.path.join(temp_dir, "layout_test_fit.mp4")
-        
+        layout_output_path = os.path.join(exports_dir, "layout_test_fit_output.mp4")
+
         try:
             result_path = process_video_for_layout(
-                original_file_path, 
-                layout_output_path, 
-                "fit", 
-                target_width=1080, 
+                original_file_path,
+                layout_output_path,
+                "fit",
+                target_width=1080,
                 target_height=1920
             )
             print(f"✅ Layout processing completed: {result_path}")
-            
+
             # Check if file exists and has content
             if os.path.exists(result_path):
                 file_size = os.path.getsize(result_path)
                 print(f"📊 Output file size: {file_size:,} bytes")
-                
-                # Copy to exports for inspection
-                exports_dir = "exports"
-                os.makedirs(exports_dir, exist_ok=True)
-                test_output = os.path.join(exports_dir, "layout_test_fit_output.mp4")
-                
-                import shutil
-                shutil.copy2(result_path, test_output)
-                print(f"📋 Copied to: {test_output}")
-                
-                # Get video info
-                probe_cmd = [
-                    'ffprobe', '-v', 'quiet', '-print_format', 'json', 
-                    '-show_streams', result_path
-                ]
-                probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
-                if probe_result.returncode == 0:
-                    import json
-                    info = json.loads(probe_result.stdout)
-                    for stream in info.get('streams', []):
-                        if stream.get('codec_type') == 'video':
-                            print(f"📺 Video dimensions: {stream.get('width')}x{stream.get('height')}")
-                            print(f"🎬 Codec: {stream.get('codec_name')}")
-                            break
-                
+
+                # Get video info - read the container in-process when PyAV
+                # is installed; an ffprobe subprocess costs a fork + JSON
+                # parse per call
+                if AV_AVAILABLE:
+                    with av.open(result_path) as container:
+                        stream = container.streams.video[0]
+                        print(f"📺 Video dimensions: {stream.width}x{stream.height}")
+                        print(f"🎬 Codec: {stream.codec_context.name}")
+                else:
+                    probe_cmd = [
+                        'ffprobe', '-v', 'quiet', '-print_format', 'json',
+                        '-show_streams', result_path
+                    ]
+                    probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
+                    if probe_result.returncode == 0:
+                        import json
+                        info = json.loads(probe_result.stdout)
+                        for stream in info.get('streams', []):
+                            if stream.get('codec_type') == 'video':
+                                print(f"📺 Video dimensions: {stream.get('width')}x{stream.get('height')}")
+                                print(f"🎬 Codec: {stream.get('codec_name')}")
+                                break
+
             else:
                 print("❌ Output file does not exist!")
                 
@@ -6,9 +6,10 @@ This tests the complete video processing pipeline including layout scaling.
 import os
 import sys
 import argparse
-from opus_processor import OpusProcessor
+import pytest
+from test_helpers import get_processor
 
-def test_layout_processing(input_video, layout_mode, output_video=None):
+def run_layout_processing(input_video, layout_mode, output_video=None, hwaccel="none"):
     """Test video layout processing with different modes using existing vertical processing."""
     
     if not os.path.exists(input_video):
@@ -25,11 +26,12 @@ def test_layout_processing(input_video, layout_mode, output_video=None):
     
     try:
         # Use existing vertical processing with layout mode
-        processor = OpusProcessor()
+        processor = get_processor()
         processor.process_video_for_vertical(
             input_path=input_video,
             output_path=output_video,
-            layout_mode=layout_mode
+            layout_mode=layout_mode,
+            hwaccel=hwaccel
         )
         
         print(f"✅ Success! Layout processed video saved: {output_video}")
@@ -48,14 +50,20 @@ def test_layout_processing(input_video, layout_mode, output_video=None):
         print(f"❌ Error during layout processing: {e}")
         return False
 
+@pytest.mark.skipif(not os.path.exists("podcast.mp4"), reason="sample video not present")
+def test_layout_processing():
+    assert run_layout_processing("podcast.mp4", "square")
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Test video layout processing")
     parser.add_argument("input_video", help="Path to input video file")
     parser.add_argument("--layout", default="square", choices=["fit", "square", "fill"], 
                        help="Layout mode to test")
     parser.add_argument("--output", help="Output video path (optional)")
+    parser.add_argument("--hwaccel", choices=["none", "cuda", "qsv", "videotoolbox"], default="none",
+                       help="Hardware decode/encode backend (falls back to CPU if unavailable)")
     
     args = parser.parse_args()
     
-    success = test_layout_processing(args.input_video, args.layout, args.output)
+    success = run_layout_processing(args.input_video, args.layout, args.output, hwaccel=args.hwaccel)
     sys.exit(0 if success else 1)
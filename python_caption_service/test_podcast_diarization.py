@@ -1,8 +1,6 @@
 import os
 import json
 import subprocess
-from opus_processor import OpusProcessor
-from faster_whisper import WhisperModel
 
 def extract_audio(video_path, audio_path):
     """Extracts audio from video file using ffmpeg."""
@@ -14,20 +12,19 @@ def extract_audio(video_path, audio_path):
     subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     print(f"Audio extracted to {audio_path}")
 
-def transcribe_audio(audio_path):
+def transcribe_audio(media_path):
     """Transcribes audio using faster-whisper and returns segments."""
-    print("Loading Whisper model...")
-    model = WhisperModel("base", device="cpu", compute_type="int8")
-    print("Transcribing audio...")
-    segments, _ = model.transcribe(audio_path, word_timestamps=True)
-    word_segments = []
-    for segment in segments:
-        for word in segment.words:
-            word_segments.append({
-                'word': word.word,
-                'start': word.start,
-                'end': word.end
-            })
+    # Imported here so collecting this module doesn't pay for numpy/whisper
+    from transcribe_cache import cached_transcribe_pcm
+
+    print("Transcribing audio (piped from ffmpeg, cached by media hash)...")
+    # Decoded straight through an ffmpeg pipe - the WAV on disk is only
+    # needed later by the PodcastPro caption pass
+    segments, _ = cached_transcribe_pcm(media_path, "base")
+    word_segments = [
+        {'word': word.word, 'start': word.start, 'end': word.end}
+        for segment in segments for word in segment.words
+    ]
     print("Transcription complete.")
     return word_segments
 
@@ -45,10 +42,12 @@ def main():
     else:
         print(f"Audio file {audio_path} already exists.")
 
-    # Step 2: Transcribe audio to get word segments
-    segments = transcribe_audio(audio_path)
+    # Step 2: Transcribe straight from the video (ffmpeg pipe, no WAV
+    # round-trip for transcription)
+    segments = transcribe_audio(video_path)
 
     # Step 3: Initialize OpusProcessor and generate captions
+    from opus_processor import OpusProcessor
     processor = OpusProcessor()
     print(f"Generating captions with '{template_name}' style...")
     ass_content = processor.generate_karaoke_captions(
@@ -62,23 +61,24 @@ def main():
         print("\nFAILURE: The processor returned empty content.")
         return
 
-    with open(output_ass_path, "w", encoding="utf-8") as f:
-        f.write(ass_content)
+    # Encode once and stream in 1 MB chunks - avoids holding a second
+    # full copy of a multi-MB caption file during the save
+    data = ass_content.encode("utf-8")
+    with open(output_ass_path, "wb", buffering=1 << 20) as f:
+        for i in range(0, len(data), 1 << 20):
+            f.write(data[i:i + (1 << 20)])
     
     print(f"\nSuccessfully generated captions: {output_ass_path}")
     print("Performing final verification...")
 
-    try:
-        with open(output_ass_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            if "1c&H" in content:
-                print("\n--- VERIFICATION PASSED ---")
-                print("SUCCESS: Color codes found in the file. The PodcastPro style is working.")
-            else:
-                print("\n--- VERIFICATION FAILED ---")
-                print("FAILURE: Color codes were NOT found in the generated file.")
-    except Exception as e:
-        print(f"\nERROR: Could not read or verify the file: {e}")
+    # Scan the bytes already in memory - no need to read the file we
+    # just wrote back off disk and decode it again
+    if b"1c&H" in data:
+        print("\n--- VERIFICATION PASSED ---")
+        print("SUCCESS: Color codes found in the file. The PodcastPro style is working.")
+    else:
+        print("\n--- VERIFICATION FAILED ---")
+        print("FAILURE: Color codes were NOT found in the generated file.")
 
 if __name__ == "__main__":
     main()
@@ -6,48 +6,22 @@ This script can be used to test the karaoke animation with actual speech.
 import os
 import sys
 import argparse
-import tempfile
-import subprocess
-from faster_whisper import WhisperModel
-from opus_processor import OpusProcessor
-
-def extract_audio_from_video(video_path, temp_dir):
-    """Extract audio from video for transcription."""
-    audio_path = os.path.join(temp_dir, "extracted_audio.wav")
-    command = [
-        'ffmpeg', '-y', '-i', video_path,
-        '-vn', '-acodec', 'pcm_s16le', '-ar', '16000', '-ac', '1',
-        audio_path
-    ]
-    try:
-        subprocess.run(command, check=True, capture_output=True)
-        return audio_path
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to extract audio: {e}")
 
 def transcribe_video_with_whisper(video_path):
     """Transcribe video using faster-whisper with word-level timestamps."""
-    print("Extracting audio from video...")
-    
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Extract audio
-        audio_path = extract_audio_from_video(video_path, temp_dir)
-        
-        print("Loading Whisper model...")
-        # Load whisper model (same as your processing.py)
-        model = WhisperModel("base", device="cpu", compute_type="int8")
-        
-        print("Transcribing audio (this may take a moment)...")
-        # Transcribe with word timestamps
-        segments, info = model.transcribe(audio_path, word_timestamps=True)
-        
-        # Convert generator to list
-        transcription_segments = list(segments)
-        
-        print(f"Transcription complete! Language: {info.language} (confidence: {info.language_probability:.2f})")
-        print(f"Found {len(transcription_segments)} segments")
-        
-        return transcription_segments
+    # Imported here so importing this module stays cheap - the whisper
+    # and numpy stacks only load when a transcription actually runs
+    from transcribe_cache import cached_transcribe_pcm
+
+    print("Transcribing audio (piped from ffmpeg, cached by media hash)...")
+    # Audio is decoded straight through an ffmpeg pipe into Whisper - no
+    # temporary WAV - and repeat runs hit the disk cache
+    transcription_segments, info = cached_transcribe_pcm(video_path, "base")
+
+    print(f"Transcription complete! Language: {info.language} (confidence: {info.language_probability:.2f})")
+    print(f"Found {len(transcription_segments)} segments")
+
+    return transcription_segments
 
 def process_real_video_captions(video_path, output_ass_path, template_name="OpusClipStyle", layout_mode="fit"):
     """
@@ -56,8 +30,9 @@ def process_real_video_captions(video_path, output_ass_path, template_name="Opus
     
     print(f"Processing video: {video_path}")
     print("Using REAL transcription from faster-whisper!")
-    
+
     # Initialize processor
+    from opus_processor import OpusProcessor
     processor = OpusProcessor()
     
 
@@ -156,6 +131,7 @@ if __name__ == "__main__":
     # --- Step 1: Process video if requested ---
     if args.vertical:
         print("\n--- Vertical Video Processing ---")
+        from opus_processor import OpusProcessor
         processor = OpusProcessor()
         vertical_output_path = f"{video_name}_vertical_{timestamp}.mp4"
         print(f"Generating vertical video: {vertical_output_path}")
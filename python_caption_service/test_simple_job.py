@@ -12,29 +12,44 @@ data = {
     "layout": "fit"
 }
 
+# One keep-alive socket shared by the submit and every status poll -
+# skips the per-request TCP handshake
+session = requests.Session()
+session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 print("Submitting job...")
-response = requests.post(url, json=data)
+response = session.post(url, json=data)
 print(f"Response: {response.status_code}")
 print(f"Job ID: {response.json()}")
 
 if response.status_code == 200:
     job_id = response.json()["job_id"]
     print(f"Job submitted successfully: {job_id}")
-    
+
     # Check job status
     status_url = f"http://localhost:5000/job_status/{job_id}"
-    
+
+    # Poll with exponential backoff: fast jobs are observed sub-second,
+    # long jobs don't flood the server with a request every 5 s
+    delay = 1.0
+    etag = None
     while True:
-        status_response = requests.get(status_url)
-        status_data = status_response.json()
-        
-        print(f"Status: {status_data['status']} - {status_data.get('progress', 0)}%")
-        if 'message' in status_data:
-            print(f"Message: {status_data['message']}")
-            
-        if status_data['status'] in ['completed', 'failed']:
-            break
-            
-        time.sleep(5)
-        
+        headers = {"If-None-Match": etag} if etag else {}
+        status_response = session.get(status_url, headers=headers)
+
+        # 304 = unchanged since last poll, nothing new to parse or print
+        if status_response.status_code != 304:
+            etag = status_response.headers.get("ETag")
+            status_data = status_response.json()
+
+            print(f"Status: {status_data['status']} - {status_data.get('progress', 0)}%")
+            if 'message' in status_data:
+                print(f"Message: {status_data['message']}")
+
+            if status_data['status'] in ['completed', 'failed']:
+                break
+
+        time.sleep(delay)
+        delay = min(delay * 1.5, 30.0)
+
     print("Final status:", status_data)
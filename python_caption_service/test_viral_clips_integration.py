@@ -8,6 +8,33 @@ import os
 from hook_detector import HookDetector, parse_whisper_segments
 from clip_processor import ClipProcessor
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def iter_exported_clips(export_path):
+    """
+    Stream clips out of an exports JSON file one at a time.
+
+    With ijson available, only one clip subtree is resident at a time -
+    summary statistics over a large export stay O(1) in memory. Without
+    it, fall back to json.load and iterate the parsed list.
+    """
+    with open(export_path, 'rb') as f:
+        if IJSON_AVAILABLE:
+            yield from ijson.items(f, 'clips.item')
+        else:
+            yield from json.load(f).get('clips', [])
+
 
 def test_viral_clips_with_fit_swipeup():
     """Test viral clip detection with fit layout and SwipeUp captions"""
@@ -124,11 +151,23 @@ def create_viral_clips_summary(clips, generated_videos):
     print(f"   Hook detection algorithm applied")
     print(f"   Sentiment analysis included")
     
+    # One pass over the clips for every aggregate instead of a separate
+    # generator sweep per statistic
+    score_sum = duration_sum = 0.0
+    score_min = float('inf')
+    score_max = float('-inf')
+    for clip in clips:
+        score = clip['score']
+        score_sum += score
+        score_min = min(score_min, score)
+        score_max = max(score_max, score)
+        duration_sum += clip['duration']
+
     print(f"\n📊 Results:")
     print(f"   Clips found: {len(clips)}")
-    print(f"   Average score: {sum(c['score'] for c in clips) / len(clips):.2f}")
-    print(f"   Score range: {min(c['score'] for c in clips):.1f} - {max(c['score'] for c in clips):.1f}")
-    print(f"   Total duration: {sum(c['duration'] for c in clips):.1f}s")
+    print(f"   Average score: {score_sum / len(clips):.2f}")
+    print(f"   Score range: {score_min:.1f} - {score_max:.1f}")
+    print(f"   Total duration: {duration_sum:.1f}s")
     
     print(f"\n🎬 Video Generation:")
     print(f"   Layout: fit (blurred background, centered video)")
@@ -144,7 +183,7 @@ def create_viral_clips_summary(clips, generated_videos):
     summary = {
         "generation_summary": {
             "total_clips": len(clips),
-            "average_score": sum(c['score'] for c in clips) / len(clips),
+            "average_score": score_sum / len(clips),
             "layout_mode": "fit",
             "caption_template": "SwipeUp",
             "clips": clips,
@@ -153,8 +192,14 @@ def create_viral_clips_summary(clips, generated_videos):
     }
     
     summary_path = "exports/viral_clips_generation_summary.json"
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        # Rust-native serializer, emits bytes - much faster on big
+        # nested clip/analysis structures
+        with open(summary_path, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
     
     print(f"\n💾 Summary exported: {summary_path}")
     
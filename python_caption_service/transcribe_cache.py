@@ -0,0 +1,119 @@
+"""
+On-disk cache for Whisper transcriptions.
+
+Transcription dominates test runtime, and the test audio never changes
+between runs - key the result on (source sha256, model, compute type)
+and pickle it, so repeated runs skip Whisper entirely.
+"""
+
+import hashlib
+import os
+import pickle
+import subprocess
+
+import numpy as np
+
+from _model_cache import detect_whisper_device, get_faster_whisper
+
+CACHE_DIR = ".whisper_cache"
+# Part of the cache key: bump when the transcription parameters below
+# change, so stale results from other settings are not reused
+CACHE_TAG = "vad-b8"
+
+
+def _audio_sha256(media_path: str) -> str:
+    h = hashlib.sha256()
+    with open(media_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _load_or_compute(cache_path: str, compute_fn):
+    """Load a pickled result, or compute and store it atomically."""
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+
+    result = compute_fn()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    partial_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(partial_path, 'wb') as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(partial_path, cache_path)
+
+    return result
+
+
+def _resolve_device(device, compute):
+    """Fill unset device/compute from the autodetected defaults."""
+    auto_device, auto_compute = detect_whisper_device()
+    return device or auto_device, compute or auto_compute
+
+
+def _decode_pcm(media_path: str) -> np.ndarray:
+    """Decode any media to 16 kHz mono float32 via an ffmpeg pipe."""
+    proc = subprocess.run(
+        ['ffmpeg', '-v', 'error', '-i', media_path, '-vn',
+         '-f', 's16le', '-acodec', 'pcm_s16le', '-ar', '16000', '-ac', '1', 'pipe:1'],
+        capture_output=True, check=True
+    )
+    return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def _transcribe(model, source):
+    """
+    Run Whisper over `source` with VAD enabled, batched when the
+    installed faster-whisper supports it. Skipping silent regions and
+    decoding chunks in parallel are both large wins on long podcasts.
+    """
+    kwargs = dict(
+        word_timestamps=True,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500),
+    )
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        # Older faster-whisper: unbatched, but still VAD-filtered
+        return model.transcribe(source, **kwargs)
+    return BatchedInferencePipeline(model=model).transcribe(source, batch_size=8, **kwargs)
+
+
+def cached_transcribe(audio_path: str, model_name: str = "base", device: str = None, compute: str = None):
+    """
+    Transcribe audio_path with word timestamps, reusing a pickled result
+    on later runs. Returns (segments, info) like model.transcribe, with
+    the segment generator already materialized.
+    """
+    device, compute = _resolve_device(device, compute)
+    cache_path = os.path.join(
+        CACHE_DIR, f"{_audio_sha256(audio_path)}_{model_name}_{compute}_{CACHE_TAG}.pkl"
+    )
+
+    def _run():
+        model = get_faster_whisper(model_name, device=device, compute=compute)
+        segments, info = _transcribe(model, audio_path)
+        return list(segments), info
+
+    return _load_or_compute(cache_path, _run)
+
+
+def cached_transcribe_pcm(media_path: str, model_name: str = "base", device: str = None, compute: str = None):
+    """
+    Like cached_transcribe, but decodes the source (video or audio)
+    through an ffmpeg pipe straight into a float32 array - no temporary
+    WAV hits the disk on a cache miss.
+    """
+    device, compute = _resolve_device(device, compute)
+    cache_path = os.path.join(
+        CACHE_DIR, f"{_audio_sha256(media_path)}_{model_name}_{compute}_{CACHE_TAG}.pkl"
+    )
+
+    def _run():
+        model = get_faster_whisper(model_name, device=device, compute=compute)
+        segments, info = _transcribe(model, _decode_pcm(media_path))
+        return list(segments), info
+
+    return _load_or_compute(cache_path, _run)
@@ -0,0 +1,50 @@
+"""
+On-disk transcript cache keyed by source identity.
+
+Unlike transcribe_cache (which hashes local audio bytes), entries here
+are keyed by (video id, model, language), so a repeat clip-generation
+request for the same URL reuses the transcript without re-running
+Whisper. Corrupt or missing entries silently fall back to a recompute.
+Set OPUSCLIP_NO_TRANSCRIPT_CACHE=1 to bypass the cache entirely.
+"""
+
+import hashlib
+import json
+import os
+from typing import Optional
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'opusclip', 'transcripts')
+
+
+def _enabled() -> bool:
+    return os.environ.get('OPUSCLIP_NO_TRANSCRIPT_CACHE') != '1'
+
+
+def make_key(video_id: str, model_name: str = "base", language: str = "") -> str:
+    """Derive the cache key for a (video, model, language) combination."""
+    return hashlib.sha256(f"{video_id}:{model_name}:{language}".encode('utf-8')).hexdigest()
+
+
+def get(key: str) -> Optional[dict]:
+    """Return the cached payload for key, or None on miss/corruption."""
+    if not _enabled():
+        return None
+    try:
+        with open(os.path.join(CACHE_DIR, f"{key}.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def put(key: str, payload: dict) -> None:
+    """Store payload under key atomically; failures are non-fatal."""
+    if not _enabled():
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        partial_path = os.path.join(CACHE_DIR, f"{key}.{os.getpid()}.tmp")
+        with open(partial_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+        os.replace(partial_path, os.path.join(CACHE_DIR, f"{key}.json"))
+    except OSError:
+        pass
@@ -11,22 +11,68 @@ Version: 1.0.0
 """
 
 import os
+import re
 import sys
 import json
 import time
 import argparse
 import tempfile
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
+from functools import lru_cache
 
-from opus_processor import OpusProcessor
-from production_layouts import ProductionLayoutProcessor
-from intelligent_auto_layout import IntelligentAutoLayout
-from faster_whisper import WhisperModel
+from _model_cache import detect_whisper_device, get_faster_whisper
+
+
+@lru_cache(maxsize=None)
+def _ffmpeg_bin() -> str:
+    """Resolve the ffmpeg executable once instead of a PATH search per spawn."""
+    import shutil
+    return shutil.which('ffmpeg') or 'ffmpeg'
+
+
+# ASS parse patterns, compiled once - these run per dialogue line in the
+# subtitle parse loops
+_ASS_DIALOGUE_RE = re.compile(
+    r'Dialogue: \d+,(\d+:\d+:\d+\.\d+),(\d+:\d+:\d+\.\d+),.*?,,\d+,\d+,\d+,,(.+)'
+)
+_ASS_DIALOGUE_TIME_RE = re.compile(
+    r'Dialogue: \d+,(\d+):(\d+):(\d+)\.(\d+),(\d+):(\d+):(\d+)\.(\d+),.*?,,\d+,\d+,\d+,,(.+)'
+)
+_ASS_TAG_RE = re.compile(r'\{[^}]*\}')
+
+# Accepted container extensions, hoisted so validate_config does not
+# rebuild the set per request
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'})
+
+
+@lru_cache(maxsize=1)
+def _pick_video_encoder() -> tuple:
+    """
+    H.264 encoder arguments for the combine passes, preferring a
+    hardware encoder when this ffmpeg build exposes one. The subtitle
+    burn (ass/subtitles filter) stays on the CPU either way; only the
+    encode moves to the device.
+    """
+    try:
+        result = subprocess.run([_ffmpeg_bin(), '-hide_banner', '-encoders'],
+                                capture_output=True, text=True)
+        encoders = result.stdout
+    except OSError:
+        encoders = ''
+    if 'h264_nvenc' in encoders:
+        return ('-c:v', 'h264_nvenc', '-preset', 'p4', '-cq', '23')
+    if 'h264_qsv' in encoders:
+        return ('-c:v', 'h264_qsv', '-global_quality', '23')
+    if 'h264_videotoolbox' in encoders:
+        return ('-c:v', 'h264_videotoolbox', '-q:v', '60')
+    return ('-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23')
 
 
 class LayoutMode(Enum):
@@ -48,7 +94,7 @@ class ProcessingStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingConfig:
     """Configuration for video processing pipeline."""
     input_video: str
@@ -62,7 +108,7 @@ class ProcessingConfig:
     dynamic_speaker: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of video processing operation."""
     success: bool
@@ -83,15 +129,37 @@ class VideoProcessingPipeline:
     """
     
     def __init__(self):
-        self.processor = OpusProcessor()
-        self.production_layouts = ProductionLayoutProcessor()
-        self.intelligent_auto = IntelligentAutoLayout()
+        # The processing stack (and its heavy import chain) is built on
+        # first use - the CLI list paths never pay for it
+        self.processor = None
+        self.production_layouts = None
+        self.intelligent_auto = None
+        self._template_names = None
         self.temp_files = []
         self.whisper_model = None
+        self.batched_whisper = None
+        # Transcripts keyed by absolute input path - rendering one source
+        # with several templates/layouts transcribes it only once
+        self._transcript_cache = {}
         
+    def _lazy_init(self):
+        """Import and construct the processing stack on first use."""
+        if self.processor is not None:
+            return
+        from opus_processor import OpusProcessor
+        from production_layouts import ProductionLayoutProcessor
+        from intelligent_auto_layout import IntelligentAutoLayout
+
+        self.production_layouts = ProductionLayoutProcessor()
+        self.intelligent_auto = IntelligentAutoLayout()
+        self.processor = OpusProcessor()
+        # Template names are static after construction - snapshot once
+        self._template_names = tuple(self.processor.templates)
+
     def get_available_templates(self) -> List[str]:
         """Get list of available caption templates."""
-        return list(self.processor.templates.keys())
+        self._lazy_init()
+        return list(self._template_names)
     
     def get_available_layouts(self) -> List[str]:
         """Get list of available layout modes."""
@@ -104,18 +172,21 @@ class VideoProcessingPipeline:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Check input file exists
-        if not os.path.exists(config.input_video):
+        self._lazy_init()
+        # Check input file exists - one stat, no separate exists probe
+        try:
+            os.stat(config.input_video)
+        except OSError:
             return False, f"Input video not found: {config.input_video}"
         
         # Check input is a video file
-        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
-        if Path(config.input_video).suffix.lower() not in video_extensions:
-            return False, f"Unsupported video format: {Path(config.input_video).suffix}"
+        suffix = Path(config.input_video).suffix
+        if suffix.lower() not in _VIDEO_EXTS:
+            return False, f"Unsupported video format: {suffix}"
         
         # Check template exists
-        if config.caption_template not in self.get_available_templates():
-            available = ', '.join(self.get_available_templates())
+        if config.caption_template not in self._template_names:
+            available = ', '.join(self._template_names)
             return False, f"Template '{config.caption_template}' not found. Available: {available}"
         
         # Check layout mode is valid
@@ -158,95 +229,243 @@ class VideoProcessingPipeline:
             
         for temp_file in self.temp_files:
             try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    if config.verbose:
-                        self._log(f"Cleaned up temp file: {os.path.basename(temp_file)}", config)
+                # Remove directly - a FileNotFoundError is cheaper than
+                # an exists() pre-check per file
+                os.remove(temp_file)
+                if config.verbose:
+                    self._log(f"Cleaned up temp file: {os.path.basename(temp_file)}", config)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 if config.verbose:
                     self._log(f"Warning: Could not clean up {temp_file}: {e}", config)
         
         self.temp_files.clear()
     
-    def _extract_audio_from_video(self, video_path: str) -> str:
-        """Extract audio from video for transcription."""
-        audio_path = self._create_temp_file("_audio.wav")
+    def _run_ffmpeg(self, command: List[str], capture_stdout: bool = False) -> Optional[bytes]:
+        """Run an ffmpeg command without unbounded stderr buffering.
+
+        capture_output would hold ffmpeg's whole log in memory for the
+        length of a transcode; instead a daemon thread drains stderr and
+        keeps only the last 4 KB, which is raised with the exit code on
+        failure. Returns stdout bytes when capture_stdout is set.
+        """
+        full_command = [_ffmpeg_bin(), '-hide_banner', '-loglevel', 'error', '-nostats'] + list(command[1:])
+        proc = subprocess.Popen(
+            full_command, stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+
+        tail = bytearray()
+
+        def _drain():
+            while True:
+                block = proc.stderr.read(4096)
+                if not block:
+                    break
+                del tail[:max(0, len(tail) + len(block) - 4096)]
+                tail.extend(block)
+
+        drainer = threading.Thread(target=_drain, daemon=True)
+        drainer.start()
+        stdout = proc.stdout.read() if capture_stdout else None
+        proc.wait()
+        drainer.join()
+
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, full_command,
+                output=stdout, stderr=bytes(tail).decode(errors='replace')
+            )
+        return stdout
+
+    def _extract_audio_from_video(self, video_path: str):
+        """Decode the audio track to 16 kHz mono float32 for transcription.
+
+        Streams raw PCM out of ffmpeg over stdout straight into a NumPy
+        array - no temporary WAV hits the disk, and whisper skips the
+        extra file parse.
+        """
+        import numpy as np
+
         command = [
-            'ffmpeg', '-y', '-i', video_path,
-            '-vn', '-acodec', 'pcm_s16le', '-ar', '16000', '-ac', '1',
-            audio_path
+            'ffmpeg', '-i', video_path, '-vn',
+            '-f', 'f32le', '-acodec', 'pcm_f32le', '-ar', '16000', '-ac', '1',
+            'pipe:1'
         ]
         try:
-            subprocess.run(command, check=True, capture_output=True)
-            return audio_path
+            pcm = self._run_ffmpeg(command, capture_stdout=True)
+            return np.frombuffer(pcm, dtype=np.float32)
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to extract audio: {e}")
     
     def _transcribe_video(self, video_path: str) -> List[Dict[str, Any]]:
         """Transcribe video using faster-whisper with word-level timestamps."""
-        # Extract audio
-        audio_path = self._extract_audio_from_video(video_path)
+        cache_key = os.path.abspath(video_path)
+        cached = self._transcript_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Decode audio straight into memory
+        audio = self._extract_audio_from_video(video_path)
         
-        # Load whisper model if not already loaded
+        # Load whisper model if not already loaded. The process-level
+        # cache means a fresh pipeline instance reuses weights loaded
+        # by an earlier one instead of paying the load again
         if self.whisper_model is None:
-            self.whisper_model = WhisperModel("base", device="cpu", compute_type="int8")
-        
-        # Transcribe with word timestamps
-        segments, info = self.whisper_model.transcribe(audio_path, word_timestamps=True)
-        
-        # Convert generator to list
-        transcription_segments = list(segments)
+            device, compute = detect_whisper_device()
+            self.whisper_model = get_faster_whisper("base", device, compute)
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                pass  # older faster-whisper: sequential transcribe below
+            else:
+                self.batched_whisper = BatchedInferencePipeline(model=self.whisper_model)
+
+        # Transcribe with word timestamps. The batched pipeline runs
+        # VAD-derived chunks through the encoder/decoder as a batch,
+        # which is several times faster than sequential 30s windows
+        # VAD short-circuits silence/music regions entirely - saves
+        # compute proportional to the silence fraction and cuts whisper's
+        # non-speech hallucinations
+        vad_kwargs = dict(vad_filter=True, vad_parameters=dict(min_silence_duration_ms=500))
+        if self.batched_whisper is not None:
+            segments, info = self.batched_whisper.transcribe(
+                audio, word_timestamps=True, batch_size=16, **vad_kwargs
+            )
+        else:
+            segments, info = self.whisper_model.transcribe(audio, word_timestamps=True, **vad_kwargs)
         
+        # Materialize the generator exactly once, into a tuple: the
+        # transcript cache hands the same object to every later caller,
+        # so it must survive repeated iteration - a raw generator would
+        # be exhausted after the first pass. tuple skips the list's
+        # growth over-allocation and makes the shared object immutable
+        transcription_segments = tuple(segments)
+
+        self._transcript_cache[cache_key] = transcription_segments
         return transcription_segments
     
+    def _run_layout(self, config: ProcessingConfig, layout_video: str):
+        """Render the layout pass for the configured mode."""
+        if config.layout_mode == LayoutMode.AUTO:
+            # Use intelligent auto layout that switches between speakers based on audio
+            self.intelligent_auto.create_intelligent_auto_layout(
+                config.input_video,
+                layout_video,
+                config.blur_strength
+            )
+        elif config.layout_mode in [LayoutMode.SIDE_BY_SIDE, LayoutMode.PICTURE_IN_PICTURE, LayoutMode.STACKED]:
+            # Use specific production-style layouts
+            if config.layout_mode == LayoutMode.SIDE_BY_SIDE:
+                self.production_layouts.create_side_by_side_layout(
+                    config.input_video, layout_video, config.blur_strength
+                )
+            elif config.layout_mode == LayoutMode.PICTURE_IN_PICTURE:
+                self.production_layouts.create_picture_in_picture_layout(
+                    config.input_video, layout_video, config.blur_strength
+                )
+            elif config.layout_mode == LayoutMode.STACKED:
+                self.production_layouts.create_stacked_layout(
+                    config.input_video, layout_video, config.blur_strength
+                )
+        else:
+            # Use standard processing
+            self.processor.process_video_for_vertical(
+                config.input_video,
+                layout_video,
+                config.blur_strength,
+                config.layout_mode.value
+            )
+
     def _combine_video_with_captions(self, video_path: str, caption_path: str, output_path: str):
-        """Combine video with ASS subtitle file using MoviePy to preserve BeastMode animations."""
+        """Combine video with ASS subtitle file, burning with ffmpeg's libass filter.
+
+        The native filter renders every animation tag in C; MoviePy's
+        per-frame Python compositing is kept only as a fallback.
+        """
+        # Parse ASS file to check there is anything to burn
+        with open(caption_path, 'r', encoding='utf-8') as f:
+            ass_content = f.read()
+
+        matches = _ASS_DIALOGUE_RE.findall(ass_content)
+
+        if not matches:
+            print("No subtitles found - copying video without captions")
+            import shutil
+            shutil.copy2(video_path, output_path)
+            return
+
+        try:
+            self._direct_ffmpeg_combine(video_path, caption_path, output_path)
+            return
+        except (subprocess.CalledProcessError, OSError) as e:
+            stderr = getattr(e, 'stderr', '') or e
+            print(f"FFmpeg ASS filter failed: {stderr} - falling back to MoviePy")
+
+        self._moviepy_combine(video_path, matches, output_path)
+
+    @staticmethod
+    def _render_caption_image(text: str):
+        """Rasterize one caption to an RGBA array with BeastMode styling.
+
+        PIL renders the glyphs in-process; MoviePy's TextClip would fork
+        an ImageMagick subprocess for every line.
+        """
+        import numpy as np
+        from PIL import Image, ImageDraw, ImageFont
+
+        try:
+            font = ImageFont.truetype('Impact', 80)
+        except OSError:
+            font = ImageFont.load_default()
+
+        # Measure with the stroke included, then draw outline and fill
+        probe = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+        left, top, right, bottom = probe.textbbox((0, 0), text, font=font, stroke_width=3)
+        image = Image.new('RGBA', (right - left + 6, bottom - top + 6), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        draw.text((3 - left, 3 - top), text, font=font, fill='lime',
+                  stroke_width=3, stroke_fill='black')
+        return np.array(image)
+
+    def _moviepy_combine(self, video_path: str, matches: list, output_path: str):
+        """Composite parsed dialogue lines onto the video with MoviePy."""
         try:
             # MoviePy imports moved to function level to avoid FFmpeg dependency issues
-            from moviepy.editor import VideoFileClip, TextClip, CompositeVideoClip
-            import re
-            
-            # Parse ASS file to extract subtitle data with timing and styling
-            with open(caption_path, 'r', encoding='utf-8') as f:
-                ass_content = f.read()
-            
-            # Extract dialogue lines with full styling information
-            dialogue_pattern = r'Dialogue: \d+,(\d+:\d+:\d+\.\d+),(\d+:\d+:\d+\.\d+),.*?,,\d+,\d+,\d+,,(.+)'
-            matches = re.findall(dialogue_pattern, ass_content)
-            
-            if not matches:
-                print("No subtitles found - copying video without captions")
-                import shutil
-                shutil.copy2(video_path, output_path)
-                return
-            
+            from moviepy.editor import VideoFileClip, ImageClip, CompositeVideoClip
+            import numpy as np
+
             # Load the video
             video = VideoFileClip(video_path)
-            
-            # Create subtitle clips with BeastMode styling
+
+            # Fold every timestamp to seconds in a handful of vector ops
+            # rather than split/int/float per line
+            fields = np.array(
+                [ts.split(':') for start, end, _ in matches for ts in (start, end)],
+                dtype=np.float64
+            )
+            seconds = fields[:, 0] * 3600 + fields[:, 1] * 60 + fields[:, 2]
+            start_times = seconds[0::2].tolist()
+            end_times = seconds[1::2].tolist()
+
+            # Create subtitle clips with BeastMode styling. Each unique
+            # caption is rendered once and reused per occurrence
+            rendered = {}
             subtitle_clips = []
-            for start_time_str, end_time_str, text in matches:
-                # Parse timing
-                start_parts = start_time_str.split(':')
-                start_time = int(start_parts[0]) * 3600 + int(start_parts[1]) * 60 + float(start_parts[2])
-                
-                end_parts = end_time_str.split(':')
-                end_time = int(end_parts[0]) * 3600 + int(end_parts[1]) * 60 + float(end_parts[2])
-                
+            for (_, _, text), start_time, end_time in zip(matches, start_times, end_times):
                 # Extract clean text (remove ASS tags)
-                clean_text = re.sub(r'\{[^}]*\}', '', text).strip()
-                
+                clean_text = _ASS_TAG_RE.sub('', text).strip()
+
                 if clean_text and end_time > start_time:
-                    # Create text clip with BeastMode styling
-                    txt_clip = TextClip(
-                        clean_text,
-                        fontsize=80,
-                        font='Impact',
-                        color='lime',  # Green color for BeastMode
-                        stroke_color='black',
-                        stroke_width=3
-                    ).set_position(('center', 'bottom')).set_start(start_time).set_duration(end_time - start_time)
-                    
+                    frame = rendered.get(clean_text)
+                    if frame is None:
+                        frame = rendered[clean_text] = self._render_caption_image(clean_text)
+                    txt_clip = ImageClip(frame).set_position(
+                        ('center', 'bottom')
+                    ).set_start(start_time).set_duration(end_time - start_time)
+
                     subtitle_clips.append(txt_clip)
             
             # Composite video with subtitles
@@ -273,108 +492,164 @@ class VideoProcessingPipeline:
                 clip.close()
                 
             print("MoviePy subtitle processing completed with BeastMode styling")
-            
+
         except ImportError:
-            print("MoviePy not available - using fallback method")
-            self._direct_ffmpeg_combine(video_path, caption_path, output_path)
+            print("MoviePy not available - copying video without captions")
+            import shutil
+            shutil.copy2(video_path, output_path)
         except Exception as e:
-            print(f"MoviePy processing failed: {e} - using fallback")
-            self._direct_ffmpeg_combine(video_path, caption_path, output_path)
-    
+            print(f"MoviePy processing failed: {e} - copying video without captions")
+            import shutil
+            shutil.copy2(video_path, output_path)
+
     def _direct_ffmpeg_combine(self, video_path: str, caption_path: str, output_path: str):
-        """Preserve complex ASS animations using direct FFmpeg ASS filter."""
+        """Preserve complex ASS animations using direct FFmpeg ASS filter.
+
+        Raises subprocess.CalledProcessError so the caller can fall back.
+        """
         import subprocess
         import os
-        
+
         # Normalize paths for Windows
         abs_video_path = os.path.abspath(video_path).replace('\\', '/')
         abs_caption_path = os.path.abspath(caption_path).replace('\\', '/')
         abs_output_path = os.path.abspath(output_path)
-        
+
         # Use subtitles filter with proper path escaping for Windows
         escaped_path = abs_caption_path.replace(':', '\\:')
         command = [
             'ffmpeg', '-y',
             '-i', abs_video_path,
             '-vf', f'subtitles=\'{escaped_path}\'',
-            '-c:v', 'libx264',
+            *_pick_video_encoder(),
             '-c:a', 'copy',
-            '-preset', 'fast',
-            '-crf', '23',
+            '-threads', '0',  # let the encoder saturate all cores
             abs_output_path
         ]
-        
-        try:
-            result = subprocess.run(command, check=True, capture_output=True, text=True)
-            print("BeastMode ASS animations preserved with libass filter")
-        except subprocess.CalledProcessError as e:
-            print(f"FFmpeg ASS filter failed: {e.stderr}")
-            # Fallback: copy video without subtitles
-            import shutil
-            shutil.copy2(video_path, output_path)
-            print("Created video without subtitles")
+
+        self._run_ffmpeg(command)
+        print("BeastMode ASS animations preserved with libass filter")
     
-    def _opencv_subtitle_overlay(self, video_path: str, caption_path: str, output_path: str):
-        """Use OpenCV to overlay subtitles frame by frame."""
-        import cv2
-        import re
-        
-        # Parse ASS file to extract text and timing
+    def _parse_ass_subtitles(self, caption_path: str) -> list:
+        """Parse (start, end, text) tuples from an ASS file, sorted by start."""
+        import numpy as np
+
         with open(caption_path, 'r', encoding='utf-8') as f:
             ass_content = f.read()
-        
+
         # Extract dialogue lines with timing
-        dialogue_pattern = r'Dialogue: \d+,(\d+):(\d+):(\d+)\.(\d+),(\d+):(\d+):(\d+)\.(\d+),.*?,,\d+,\d+,\d+,,(.+)'
-        matches = re.findall(dialogue_pattern, ass_content)
-        
-        subtitles = []
-        for match in matches:
-            start_h, start_m, start_s, start_ms = map(int, match[:4])
-            end_h, end_m, end_s, end_ms = map(int, match[4:8])
-            text = re.sub(r'\{[^}]*\}', '', match[8]).strip()  # Remove ASS tags
-            
-            start_time = start_h * 3600 + start_m * 60 + start_s + start_ms / 100
-            end_time = end_h * 3600 + end_m * 60 + end_s + end_ms / 100
-            
-            if text:
-                subtitles.append((start_time, end_time, text))
-        
+        matches = _ASS_DIALOGUE_TIME_RE.findall(ass_content)
+        if not matches:
+            return []
+
+        # Fold all timestamp fields to seconds in three vector ops
+        # instead of per-line int()/float() calls
+        fields = np.array([m[:8] for m in matches], dtype=np.float64)
+        starts = fields[:, 0] * 3600 + fields[:, 1] * 60 + fields[:, 2] + fields[:, 3] / 100
+        ends = fields[:, 4] * 3600 + fields[:, 5] * 60 + fields[:, 6] + fields[:, 7] / 100
+        texts = [_ASS_TAG_RE.sub('', m[8]).strip() for m in matches]
+
+        subtitles = [
+            (start, end, text)
+            for start, end, text in zip(starts.tolist(), ends.tolist(), texts)
+            if text
+        ]
+        subtitles.sort(key=lambda s: s[0])
+        return subtitles
+
+    def _drawtext_subtitle_overlay(self, video_path: str, caption_path: str, output_path: str):
+        """Overlay subtitles with a single ffmpeg drawtext filter chain.
+
+        One time-gated drawtext per caption line, all running in ffmpeg's
+        threaded pipeline - no per-frame Python pixel work.
+        """
+        subtitles = self._parse_ass_subtitles(caption_path)
+        if not subtitles:
+            import shutil
+            shutil.copy2(video_path, output_path)
+            return
+
+        def _escape(text):
+            # Filter-graph escaping: backslash, quote and colon are special
+            return text.replace('\\', '\\\\').replace("'", r"\'").replace(':', r'\:')
+
+        filters = ','.join(
+            f"drawtext=enable='between(t,{start:.3f},{end:.3f})':text='{_escape(text)}'"
+            ":fontcolor=lime:fontsize=80:bordercolor=black:borderw=3"
+            ":x=(w-text_w)/2:y=h-100"
+            for start, end, text in subtitles
+        )
+
+        command = [
+            'ffmpeg', '-y',
+            '-i', video_path,
+            '-vf', filters,
+            *_pick_video_encoder(),
+            '-c:a', 'copy',
+            output_path
+        ]
+        self._run_ffmpeg(command)
+        print("Drawtext subtitle overlay completed")
+
+    def _opencv_subtitle_overlay(self, video_path: str, caption_path: str, output_path: str, use_opencv: bool = False):
+        """Overlay subtitles frame by frame.
+
+        Defaults to the native ffmpeg drawtext chain; pass use_opencv=True
+        to force the original OpenCV per-frame loop.
+        """
+        if not use_opencv:
+            return self._drawtext_subtitle_overlay(video_path, caption_path, output_path)
+
+        import cv2
+        import numpy as np
+
+        subtitles = self._parse_ass_subtitles(caption_path)
+
+        # Parallel arrays so the per-frame lookup is a binary search
+        # instead of a scan over every caption line
+        starts = np.array([s for s, _, _ in subtitles])
+        ends = np.array([e for _, e, _ in subtitles])
+        texts = [t for _, _, t in subtitles]
+
         # Process video with OpenCV
         cap = cv2.VideoCapture(video_path)
         fps = cap.get(cv2.CAP_PROP_FPS)
         width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        
+
         fourcc = cv2.VideoWriter_fourcc(*'mp4v')
         out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
-        
+
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        font_scale = 2
+        color = (0, 255, 0)  # Green color for BeastMode style
+        thickness = 3
+        # Text size is constant per caption - measure each string once
+        text_positions = {}
+
         frame_count = 0
         while True:
             ret, frame = cap.read()
             if not ret:
                 break
-            
+
             current_time = frame_count / fps
-            
-            # Find active subtitle
-            for start_time, end_time, text in subtitles:
-                if start_time <= current_time <= end_time:
-                    # Add subtitle to frame
-                    font = cv2.FONT_HERSHEY_SIMPLEX
-                    font_scale = 2
-                    color = (0, 255, 0)  # Green color for BeastMode style
-                    thickness = 3
-                    
+
+            # Find active subtitle: last caption starting at or before
+            # current_time, if it hasn't ended yet
+            i = np.searchsorted(starts, current_time, side='right') - 1
+            if i >= 0 and current_time <= ends[i]:
+                text = texts[i]
+                if text not in text_positions:
                     # Position text at bottom center
                     text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
-                    text_x = (width - text_size[0]) // 2
-                    text_y = height - 100
-                    
-                    # Add black outline
-                    cv2.putText(frame, text, (text_x, text_y), font, font_scale, (0, 0, 0), thickness + 2)
-                    cv2.putText(frame, text, (text_x, text_y), font, font_scale, color, thickness)
-                    break
-            
+                    text_positions[text] = ((width - text_size[0]) // 2, height - 100)
+                text_x, text_y = text_positions[text]
+
+                # Add black outline
+                cv2.putText(frame, text, (text_x, text_y), font, font_scale, (0, 0, 0), thickness + 2)
+                cv2.putText(frame, text, (text_x, text_y), font, font_scale, color, thickness)
+
             out.write(frame)
             frame_count += 1
         
@@ -399,20 +674,18 @@ class VideoProcessingPipeline:
                 'ffmpeg', '-y',
                 '-i', video_path,
                 '-i', temp_ass,
-                '-c:v', 'libx264',
+                *_pick_video_encoder(),
                 '-c:a', 'copy',
                 '-c:s', 'mov_text',
                 '-map', '0:v:0',
-                '-map', '0:a:0', 
+                '-map', '0:a:0',
                 '-map', '1:s:0',
-                '-preset', 'fast',
-                '-crf', '23',
                 output_path
             ]
             
             try:
                 # First try: embed subtitles as stream
-                result = subprocess.run(command, check=True, capture_output=True, text=True)
+                self._run_ffmpeg(command)
             except subprocess.CalledProcessError:
                 try:
                     # Second try: burn subtitles with libass (most compatible with ASS)
@@ -420,13 +693,11 @@ class VideoProcessingPipeline:
                         'ffmpeg', '-y',
                         '-i', video_path,
                         '-vf', f'libass={temp_ass.replace(chr(92), "/")}',
-                        '-c:v', 'libx264',
+                        *_pick_video_encoder(),
                         '-c:a', 'copy',
-                        '-preset', 'fast', 
-                        '-crf', '23',
                         output_path
                     ]
-                    result = subprocess.run(command, check=True, capture_output=True, text=True)
+                    self._run_ffmpeg(command)
                 except subprocess.CalledProcessError:
                     # Final try: use subtitles filter with escaped path
                     escaped_path = temp_ass.replace('\\', '/').replace(':', r'\:')
@@ -434,38 +705,37 @@ class VideoProcessingPipeline:
                         'ffmpeg', '-y',
                         '-i', video_path,
                         '-vf', f'subtitles={escaped_path}',
-                        '-c:v', 'libx264',
+                        *_pick_video_encoder(),
                         '-c:a', 'copy',
-                        '-preset', 'fast',
-                        '-crf', '23', 
                         output_path
                     ]
-                    result = subprocess.run(command, check=True, capture_output=True, text=True)
+                    self._run_ffmpeg(command)
     
     def _convert_ass_to_srt(self, ass_path: str, srt_path: str):
         """Convert ASS file to SRT format for better FFmpeg compatibility."""
-        import re
-        
         with open(ass_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
         # Extract dialogue lines
-        dialogue_pattern = r'Dialogue: \d+,(\d+:\d+:\d+\.\d+),(\d+:\d+:\d+\.\d+),.*?,,\d+,\d+,\d+,,(.+)'
-        matches = re.findall(dialogue_pattern, content)
-        
-        srt_content = []
-        for i, (start, end, text) in enumerate(matches, 1):
-            # Clean ASS formatting tags
-            clean_text = re.sub(r'\{[^}]*\}', '', text).strip()
-            if clean_text:
-                # Convert time format
-                start_srt = start.replace('.', ',')
-                end_srt = end.replace('.', ',')
-                
-                srt_content.append(f"{i}\n{start_srt} --> {end_srt}\n{clean_text}\n")
-        
+        matches = _ASS_DIALOGUE_RE.findall(content)
+
+        # Single pass, streamed: blocks go straight to writelines, so no
+        # intermediate list or joined string materializes for huge files
+        cleaned = (
+            (start, end, _ASS_TAG_RE.sub('', text).strip())
+            for start, end, text in matches
+        )
+
+        def _blocks():
+            for i, (start, end, clean_text) in enumerate(
+                ((s, e, c) for s, e, c in cleaned if c), 1
+            ):
+                if i > 1:
+                    yield '\n'
+                yield f"{i}\n{start.replace('.', ',')} --> {end.replace('.', ',')}\n{clean_text}\n"
+
         with open(srt_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(srt_content))
+            f.writelines(_blocks())
     
     def _combine_with_burned_subtitles(self, video_path: str, caption_path: str, output_path: str):
         """Fallback method to burn subtitles directly into video."""
@@ -480,15 +750,13 @@ class VideoProcessingPipeline:
             'ffmpeg', '-y',
             '-i', video_path,
             '-vf', f'ass={escaped_path}',
-            '-c:v', 'libx264',
+            *_pick_video_encoder(),
             '-c:a', 'copy',
-            '-preset', 'fast',
-            '-crf', '23',
             output_filename
         ]
         
         try:
-            result = subprocess.run(command, check=True, capture_output=True, text=True)
+            self._run_ffmpeg(command)
             
             # Move the file to the desired location if different
             if output_filename != output_path and os.path.exists(output_filename):
@@ -498,6 +766,54 @@ class VideoProcessingPipeline:
             stderr_output = e.stderr if hasattr(e, 'stderr') else 'No error details'
             raise RuntimeError(f"FFmpeg failed to combine video with captions using both methods. Error: {stderr_output}")
     
+    def process_video_batch(self, configs: List[ProcessingConfig]) -> List[ProcessingResult]:
+        """
+        Process several configurations, transcribing each unique input once.
+
+        A/B runs that render the same source with different templates or
+        layouts share one transcription through the transcript cache
+        instead of re-extracting and re-transcribing per config.
+        """
+        for config in configs:
+            if os.path.exists(config.input_video):
+                # Warms the cache; later process_video calls hit it
+                self._transcribe_video(config.input_video)
+
+        return [self.process_video(config) for config in configs]
+
+    def run_pipeline(self, configs: List[ProcessingConfig]) -> List[ProcessingResult]:
+        """
+        Process a queue of videos as a staged pipeline.
+
+        A bounded queue sits between a transcription worker and the
+        render stage, so whisper is already chewing on video K+1 while
+        video K is still in its ffmpeg layout/burn pass. Each stage
+        saturates its own resource instead of the whole queue running
+        strictly serially; the maxsize bound keeps at most two decoded
+        transcripts ahead of the renderer.
+        """
+        import queue
+
+        transcribed = queue.Queue(maxsize=2)
+
+        def _transcriber():
+            for config in configs:
+                try:
+                    if os.path.exists(config.input_video):
+                        # Warms the transcript cache; process_video hits it
+                        self._transcribe_video(config.input_video)
+                except Exception:
+                    pass  # process_video reports the failure for this config
+                transcribed.put(config)
+
+        worker = threading.Thread(target=_transcriber, daemon=True)
+        worker.start()
+
+        # Single producer keeps queue order aligned with configs order
+        results = [self.process_video(transcribed.get()) for _ in configs]
+        worker.join()
+        return results
+
     def process_video(self, config: ProcessingConfig) -> ProcessingResult:
         """
         Process video with specified configuration.
@@ -522,65 +838,67 @@ class VideoProcessingPipeline:
             
             self._log("✅ Configuration validated successfully", config)
             
-            # Step 2: Process video layout
-            self._log(f"🎬 Processing video layout ({config.layout_mode.value})...", config)
-            layout_video = self._create_temp_file("_layout.mp4")
-            
-            # Process video with layout
-            if config.layout_mode == LayoutMode.AUTO:
-                # Use intelligent auto layout that switches between speakers based on audio
-                self.intelligent_auto.create_intelligent_auto_layout(
-                    config.input_video, 
-                    layout_video,
-                    config.blur_strength
+            if config.layout_mode in (LayoutMode.FIT, LayoutMode.FILL, LayoutMode.SQUARE):
+                # Steps 2-4 fused: the standard vertical layouts burn
+                # their captions inside the same ffmpeg filtergraph, so
+                # the pixels are decoded and encoded exactly once and no
+                # intermediate layout file is written
+                self._log(f"🎬 Generating captions ({config.caption_template})...", config)
+                segments = self._transcribe_video(config.input_video)
+
+                caption_file = self.processor.generate_karaoke_captions(
+                    segments,
+                    config.caption_template,
+                    layout_mode=config.layout_mode.value
                 )
-            elif config.layout_mode in [LayoutMode.SIDE_BY_SIDE, LayoutMode.PICTURE_IN_PICTURE, LayoutMode.STACKED]:
-                # Use specific production-style layouts
-                if config.layout_mode == LayoutMode.SIDE_BY_SIDE:
-                    self.production_layouts.create_side_by_side_layout(
-                        config.input_video, layout_video, config.blur_strength
-                    )
-                elif config.layout_mode == LayoutMode.PICTURE_IN_PICTURE:
-                    self.production_layouts.create_picture_in_picture_layout(
-                        config.input_video, layout_video, config.blur_strength
-                    )
-                elif config.layout_mode == LayoutMode.STACKED:
-                    self.production_layouts.create_stacked_layout(
-                        config.input_video, layout_video, config.blur_strength
-                    )
-            else:
-                # Use standard processing
-                self.processor.process_video_for_vertical(
-                    config.input_video, 
-                    layout_video,
+
+                # Track caption file for cleanup
+                self.temp_files.append(caption_file)
+                self._log("✅ Caption generation completed", config)
+
+                self._log(f"🎯 Rendering layout ({config.layout_mode.value}) and burning captions in one pass...", config)
+                self.processor.process_video_layout_and_burn_captions(
+                    config.input_video,
+                    caption_file,
+                    config.output_video,
                     config.blur_strength,
                     config.layout_mode.value
                 )
-            
-            self._log("✅ Video layout processing completed", config)
-            
-            # Step 3: Generate captions
-            self._log(f"🎬 Generating captions ({config.caption_template})...", config)
-            segments = self._transcribe_video(config.input_video)
-            
-            caption_file = self.processor.generate_karaoke_captions(
-                segments,
-                config.caption_template,
-                layout_mode=config.layout_mode.value
-            )
-            
-            # Track caption file for cleanup
-            self.temp_files.append(caption_file)
-            self._log("✅ Caption generation completed", config)
-            
-            # Step 4: Combine video and captions
-            self._log("🎯 Combining video and captions...", config)
-            self._combine_video_with_captions(
-                layout_video,
-                caption_file,
-                config.output_video
-            )
-            
+            else:
+                # Steps 2+3: Process video layout and transcribe concurrently.
+                # Captions come from the original input audio, so the layout
+                # render and the Whisper pass share no data - both spend their
+                # time in subprocess/C code, so two threads overlap them fully
+                self._log(f"🎬 Processing video layout ({config.layout_mode.value})...", config)
+                layout_video = self._create_temp_file("_layout.mp4")
+
+                self._log(f"🎬 Generating captions ({config.caption_template})...", config)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    layout_future = executor.submit(self._run_layout, config, layout_video)
+                    segments_future = executor.submit(self._transcribe_video, config.input_video)
+                    layout_future.result()
+                    segments = segments_future.result()
+
+                self._log("✅ Video layout processing completed", config)
+
+                caption_file = self.processor.generate_karaoke_captions(
+                    segments,
+                    config.caption_template,
+                    layout_mode=config.layout_mode.value
+                )
+
+                # Track caption file for cleanup
+                self.temp_files.append(caption_file)
+                self._log("✅ Caption generation completed", config)
+
+                # Step 4: Combine video and captions
+                self._log("🎯 Combining video and captions...", config)
+                self._combine_video_with_captions(
+                    layout_video,
+                    caption_file,
+                    config.output_video
+                )
+
             self._log("✅ Video and caption combination completed", config)
             
             # Step 5: Generate metadata
@@ -1,6 +1,7 @@
 import os
+import multiprocessing
 from redis import Redis
-from rq import Worker, Queue, SimpleWorker
+from rq import Worker, SimpleWorker
 import logging
 import sys
 import time
@@ -9,9 +10,27 @@ import time
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Fork start method so children inherit the preloaded model below via
+# copy-on-write instead of reloading it (macOS defaults to spawn)
+if sys.platform != "win32":
+    try:
+        multiprocessing.set_start_method('fork')
+    except RuntimeError:
+        pass  # already set by the embedding process
+
+# Keep BLAS/torch single-threaded in the parent so forked job processes
+# don't each spin up a full thread pool on top of FFmpeg's own threads
+try:
+    import torch
+    torch.set_num_threads(1)
+except ImportError:
+    pass
+
 # Preload the Whisper model and other dependencies by importing the processing
 # module. This ensures the model is loaded into memory once when the worker
-# starts, rather than on the first job, which improves performance.
+# starts, rather than on the first job, which improves performance. RQ's
+# Worker forks per job, so every job starts with the weights already
+# mapped (copy-on-write) - zero reload latency.
 logger.info("Pre-loading dependencies from 'processing' module...")
 import processing
 logger.info("'processing' module loaded successfully.")
@@ -25,21 +44,45 @@ listen = ['default']
 redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
 conn = Redis.from_url(redis_url)
 
+
+def _run_worker(index: int = 0) -> None:
+    """Run one worker loop; each process opens its own Redis connection."""
+    # Never share a Redis socket across processes - each worker dials
+    # its own connection
+    worker_conn = Redis.from_url(redis_url)
+    name = f'opus-caption-worker-{index}'
+    # Use the forking Worker wherever fork exists so jobs share the
+    # preloaded model; SimpleWorker only on Windows or when
+    # RQ_WORKER_TYPE=simple is set as an escape hatch
+    if sys.platform == "win32" or os.getenv('RQ_WORKER_TYPE') == 'simple':
+        worker = SimpleWorker(listen, connection=worker_conn, name=name)
+    else:
+        worker = Worker(listen, connection=worker_conn, name=name)
+    worker.work()
+
+
 if __name__ == '__main__':
     print("Starting RQ worker...")
     
-    # Create queue and worker - use SimpleWorker on Windows
-    queue = Queue('default', connection=conn, job_timeout=600)  # Set timeout on queue
-    if sys.platform == "win32":
-        worker = SimpleWorker(['default'], connection=conn, name='opus-caption-worker')
-    else:
-        worker = Worker(['default'], connection=conn, name='opus-caption-worker')
-    
-    # Check for existing jobs and process them
-    print(f"Checking queue... Found {len(queue)} jobs")
+    # No startup Queue probe: the worker builds its own Queue objects,
+    # and the job timeout is set where jobs are enqueued
+    # (queue_manager.enqueue_processing_job), which is what RQ honors
     
+    # Caption burn-in and transcode jobs are CPU-parallel; run several
+    # worker processes when asked. RQ_CONCURRENCY=1 keeps the classic
+    # single in-process worker.
+    concurrency = int(os.getenv('RQ_CONCURRENCY', '1'))
     try:
-        worker.work()
+        if concurrency > 1:
+            print(f"Launching {concurrency} worker processes...")
+            procs = [multiprocessing.Process(target=_run_worker, args=(i,), daemon=False)
+                     for i in range(concurrency)]
+            for p in procs:
+                p.start()
+            for p in procs:
+                p.join()
+        else:
+            _run_worker()
     except KeyboardInterrupt:
         print("\nRQ worker shutting down.")
     print("RQ worker has stopped.")
\ No newline at end of file